@@ -4,40 +4,22 @@ eInvoice News Crawler - Main Orchestrator
 Runs all configured crawlers and updates the news.json data file
 """
 
-import json
+import hashlib
 import logging
+import os
 import sys
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, FrozenSet
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+import orjson
+
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-from sources import (
-    ZATCACrawler,
-    EYCrawler,
-    AvalaraCrawler,
-    PageroCrawler,
-    EDICOMCrawler,
-    VertexCrawler,
-    SovosCrawler,
-    LinkedInCrawler,
-    VATUpdateCrawler,
-    UAEFTACrawler,
-    PageroAtlasCrawler,
-    ComarchCrawler,
-    EgyptETACrawler,
-    OmanOTACrawler,
-    JordanISTDCrawler,
-    BahrainNBRCrawler,
-    QatarGTACrawler,
-    GulfNewsCrawler,
-    ArabianBusinessCrawler,
-    ZawyaCrawler,
-    KhaleejTimesCrawler,
-)
+import sources
+from sources.base import session_pool
 from utils import merge_with_existing, deduplicate_articles
 
 # Configure logging
@@ -51,53 +33,59 @@ logger = logging.getLogger(__name__)
 PROJECT_ROOT = Path(__file__).parent.parent
 DATA_DIR = PROJECT_ROOT / 'data'
 NEWS_FILE = DATA_DIR / 'news.json'
+# Time and status of the latest run; rewritten every run, even when news.json is not
+SYNC_FILE = DATA_DIR / 'last_sync.json'
 
-# Crawler configurations
+# Crawler configurations (class names in sources, imported when run)
 CRAWLERS = [
     # News Aggregators (HIGH VALUE)
-    VATUpdateCrawler,
+    'VATUpdateCrawler',
 
     # Official Government Sources - Middle East
-    ZATCACrawler,        # Saudi Arabia
-    UAEFTACrawler,       # UAE
-    EgyptETACrawler,     # Egypt
-    OmanOTACrawler,      # Oman
-    JordanISTDCrawler,   # Jordan
-    BahrainNBRCrawler,   # Bahrain
-    QatarGTACrawler,     # Qatar
+    'ZATCACrawler',        # Saudi Arabia
+    'UAEFTACrawler',       # UAE
+    'EgyptETACrawler',     # Egypt
+    'OmanOTACrawler',      # Oman
+    'JordanISTDCrawler',   # Jordan
+    'BahrainNBRCrawler',   # Bahrain
+    'QatarGTACrawler',     # Qatar
 
     # Advisory (Big 4)
-    EYCrawler,
+    'EYCrawler',
 
     # Middle East News Sources
-    GulfNewsCrawler,         # UAE/GCC
-    ArabianBusinessCrawler,  # MENA
-    ZawyaCrawler,            # MENA (Reuters)
-    KhaleejTimesCrawler,     # UAE
+    'GulfNewsCrawler',         # UAE/GCC
+    'ArabianBusinessCrawler',  # MENA
+    'ZawyaCrawler',            # MENA (Reuters)
+    'KhaleejTimesCrawler',     # UAE
 
     # Vendors with Compliance Content
-    PageroAtlasCrawler,
-    EDICOMCrawler,
-    VertexCrawler,
-    SovosCrawler,
-    ComarchCrawler,
+    'PageroAtlasCrawler',
+    'EDICOMCrawler',
+    'VertexCrawler',
+    'SovosCrawler',
+    'ComarchCrawler',
 
     # Other Vendors (may be blocked)
-    AvalaraCrawler,
-    PageroCrawler,
+    'AvalaraCrawler',
+    'PageroCrawler',
 
     # Social
-    LinkedInCrawler,
+    'LinkedInCrawler',
 ]
 
+# One worker per crawler: crawlers are I/O bound, and requests to the same
+# host are capped by the per-host limit in sources.base
+MAX_WORKERS = len(CRAWLERS)
+
 
 def load_existing_news() -> Dict:
     """Load existing news data from file"""
     if NEWS_FILE.exists():
         try:
-            with open(NEWS_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
+            with open(NEWS_FILE, 'rb') as f:
+                return orjson.loads(f.read())
+        except (orjson.JSONDecodeError, IOError) as e:
             logger.error(f"Failed to load existing news: {e}")
 
     return {
@@ -108,44 +96,83 @@ def load_existing_news() -> Dict:
     }
 
 
-def save_news(news_data: Dict) -> None:
-    """Save news data to file"""
+def write_json(path: Path, data: Dict) -> None:
+    """Write data to a JSON file atomically (write a temp file, then rename over)"""
     # Ensure data directory exists
-    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(NEWS_FILE, 'w', encoding='utf-8') as f:
-        json.dump(news_data, f, indent=2, ensure_ascii=False)
+    # orjson output with OPT_INDENT_2 matches json.dump(indent=2, ensure_ascii=False)
+    tmp_file = path.with_suffix('.json.tmp')
+    with open(tmp_file, 'wb') as f:
+        f.write(orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, path)
 
+
+def save_news(news_data: Dict) -> None:
+    """Save news data and its sync time"""
+    write_json(NEWS_FILE, news_data)
     logger.info(f"Saved {news_data['totalArticles']} articles to {NEWS_FILE}")
+    save_sync(news_data)
+
+
+def save_sync(news_data: Dict) -> None:
+    """Save the run's lastUpdated and crawlStatus to the sidecar the frontend reads"""
+    write_json(SYNC_FILE, {
+        'lastUpdated': news_data['lastUpdated'],
+        'crawlStatus': news_data['crawlStatus'],
+    })
 
 
-def run_crawler(crawler_class) -> List[Dict]:
-    """Run a single crawler and return articles"""
-    crawler = crawler_class()
+def compute_articles_hash(articles: List[Dict]) -> str:
+    """Hash of the set of article ids, used to detect runs that changed nothing"""
+    ids = sorted(article.get('id', '') for article in articles)
+    return hashlib.blake2b('\n'.join(ids).encode(), digest_size=16).hexdigest()
+
+
+def utc_timestamp() -> str:
+    """Current UTC time as an ISO 8601 string with a Z suffix"""
+    return datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+
+
+def run_crawler(crawler_name: str, known_urls: FrozenSet[str] = frozenset()) -> List[Dict]:
+    """Run a single crawler and return articles not already in known_urls"""
+    crawler = getattr(sources, crawler_name)()
+    crawler.known_urls = known_urls
     return crawler.safe_crawl()
 
 
-def run_all_crawlers() -> List[Dict]:
-    """Run all crawlers in parallel and collect articles"""
+def run_all_crawlers(known_urls: FrozenSet[str] = frozenset()) -> List[Dict]:
+    """Run all crawlers in parallel and collect articles not already in known_urls"""
     all_articles = []
+    seen_ids = set()
 
-    # Use ThreadPoolExecutor for parallel crawling
-    with ThreadPoolExecutor(max_workers=5) as executor:
-        # Submit all crawlers
-        future_to_crawler = {
-            executor.submit(run_crawler, crawler): crawler
-            for crawler in CRAWLERS
-        }
-
-        # Collect results as they complete
-        for future in as_completed(future_to_crawler):
-            crawler = future_to_crawler[future]
-            try:
-                articles = future.result()
-                all_articles.extend(articles)
-                logger.info(f"{crawler.__name__}: Collected {len(articles)} articles")
-            except Exception as e:
-                logger.error(f"{crawler.__name__}: Failed - {e}")
+    try:
+        # Use ThreadPoolExecutor for parallel crawling
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            # Submit all crawlers
+            future_to_crawler = {
+                executor.submit(run_crawler, crawler, known_urls): crawler
+                for crawler in CRAWLERS
+            }
+
+            # Collect results as they complete
+            for future in as_completed(future_to_crawler):
+                crawler = future_to_crawler[future]
+                try:
+                    articles = future.result()
+                    for article in articles:
+                        # Drop exact repeats early so the deduplicator has less to compare
+                        if article['id'] not in seen_ids:
+                            seen_ids.add(article['id'])
+                            all_articles.append(article)
+                    logger.info(f"{crawler}: Collected {len(articles)} articles")
+                except Exception as e:
+                    logger.error(f"{crawler}: Failed - {e}")
+    finally:
+        # Close pooled sessions and their cache handles even if a crawl run fails
+        session_pool.close()
 
     return all_articles
 
@@ -156,8 +183,9 @@ def main():
     logger.info("eInvoice News Crawler - Starting")
     logger.info("=" * 60)
 
-    start_time = datetime.utcnow()
+    start_time = datetime.now(timezone.utc)
     crawl_status = 'success'
+    existing_data = None
 
     try:
         # Load existing news
@@ -165,8 +193,9 @@ def main():
         existing_articles = existing_data.get('articles', [])
         logger.info(f"Loaded {len(existing_articles)} existing articles")
 
-        # Run all crawlers
-        new_articles = run_all_crawlers()
+        # Run all crawlers, skipping articles already stored
+        known_urls = frozenset(article.get('url') for article in existing_articles)
+        new_articles = run_all_crawlers(known_urls)
         logger.info(f"Crawled {len(new_articles)} new articles")
 
         # Merge and deduplicate
@@ -178,30 +207,37 @@ def main():
         logger.info(f"After deduplication: {len(merged_articles)} articles")
 
         # Prepare output data
+        content_hash = compute_articles_hash(merged_articles)
         news_data = {
-            'lastUpdated': datetime.utcnow().isoformat() + 'Z',
+            'lastUpdated': utc_timestamp(),
             'crawlStatus': crawl_status,
             'totalArticles': len(merged_articles),
+            'contentHash': content_hash,
             'articles': merged_articles
         }
 
-        # Save to file
-        save_news(news_data)
+        # Save to file, unless the run changed neither the articles nor the status
+        if content_hash == existing_data.get('contentHash') and existing_data.get('crawlStatus') == crawl_status:
+            # Still record the sync, so the site does not look stale
+            logger.info(f"No new articles; leaving {NEWS_FILE} unchanged")
+            save_sync(news_data)
+        else:
+            save_news(news_data)
 
     except Exception as e:
         logger.error(f"Crawl failed: {e}")
         crawl_status = 'failed'
 
-        # Save error status
-        news_data = load_existing_news()
-        news_data['lastUpdated'] = datetime.utcnow().isoformat() + 'Z'
+        # Save error status (reuse the already parsed file when available)
+        news_data = existing_data if existing_data is not None else load_existing_news()
+        news_data['lastUpdated'] = utc_timestamp()
         news_data['crawlStatus'] = crawl_status
         save_news(news_data)
 
         sys.exit(1)
 
     # Summary
-    elapsed = (datetime.utcnow() - start_time).total_seconds()
+    elapsed = (datetime.now(timezone.utc) - start_time).total_seconds()
     logger.info("=" * 60)
     logger.info(f"Crawl completed in {elapsed:.1f} seconds")
     logger.info(f"Status: {crawl_status}")
@@ -1,51 +1,49 @@
 """
 Source crawlers for the eInvoice News Crawler
+
+Crawler classes are imported on first access (PEP 562), so a run only pays
+the import cost of the crawlers it actually uses.
 """
 
-from sources.base import BaseCrawler
-from sources.zatca import ZATCACrawler
-from sources.ey import EYCrawler
-from sources.avalara import AvalaraCrawler
-from sources.pagero import PageroCrawler
-from sources.edicom import EDICOMCrawler
-from sources.vertex import VertexCrawler
-from sources.sovos import SovosCrawler
-from sources.linkedin import LinkedInCrawler
-from sources.vatupdate import VATUpdateCrawler
-from sources.uae_fta import UAEFTACrawler
-from sources.pagero_atlas import PageroAtlasCrawler
-from sources.comarch import ComarchCrawler
-from sources.egypt_eta import EgyptETACrawler
-from sources.oman_ota import OmanOTACrawler
-from sources.jordan_istd import JordanISTDCrawler
-from sources.bahrain_nbr import BahrainNBRCrawler
-from sources.qatar_gta import QatarGTACrawler
-from sources.gulf_news import GulfNewsCrawler
-from sources.arabian_business import ArabianBusinessCrawler
-from sources.zawya import ZawyaCrawler
-from sources.khaleej_times import KhaleejTimesCrawler
-
-__all__ = [
-    'BaseCrawler',
-    'ZATCACrawler',
-    'EYCrawler',
-    'AvalaraCrawler',
-    'PageroCrawler',
-    'EDICOMCrawler',
-    'VertexCrawler',
-    'SovosCrawler',
-    'LinkedInCrawler',
-    'VATUpdateCrawler',
-    'UAEFTACrawler',
-    'PageroAtlasCrawler',
-    'ComarchCrawler',
-    'EgyptETACrawler',
-    'OmanOTACrawler',
-    'JordanISTDCrawler',
-    'BahrainNBRCrawler',
-    'QatarGTACrawler',
-    'GulfNewsCrawler',
-    'ArabianBusinessCrawler',
-    'ZawyaCrawler',
-    'KhaleejTimesCrawler',
-]
+import importlib
+
+# Public name -> module that defines it
+_MODULES = {
+    'BaseCrawler': 'sources.base',
+    'ZATCACrawler': 'sources.zatca',
+    'EYCrawler': 'sources.ey',
+    'AvalaraCrawler': 'sources.avalara',
+    'PageroCrawler': 'sources.pagero',
+    'EDICOMCrawler': 'sources.edicom',
+    'VertexCrawler': 'sources.vertex',
+    'SovosCrawler': 'sources.sovos',
+    'LinkedInCrawler': 'sources.linkedin',
+    'VATUpdateCrawler': 'sources.vatupdate',
+    'UAEFTACrawler': 'sources.uae_fta',
+    'PageroAtlasCrawler': 'sources.pagero_atlas',
+    'ComarchCrawler': 'sources.comarch',
+    'EgyptETACrawler': 'sources.egypt_eta',
+    'OmanOTACrawler': 'sources.oman_ota',
+    'JordanISTDCrawler': 'sources.jordan_istd',
+    'BahrainNBRCrawler': 'sources.bahrain_nbr',
+    'QatarGTACrawler': 'sources.qatar_gta',
+    'GulfNewsCrawler': 'sources.gulf_news',
+    'ArabianBusinessCrawler': 'sources.arabian_business',
+    'ZawyaCrawler': 'sources.zawya',
+    'KhaleejTimesCrawler': 'sources.khaleej_times',
+}
+
+__all__ = list(_MODULES)
+
+
+def __getattr__(name):
+    if name in _MODULES:
+        value = getattr(importlib.import_module(_MODULES[name]), name)
+        # Cache on the package so later lookups skip __getattr__
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -4,11 +4,10 @@ Crawls e-invoicing news from Avalara blog
 """
 
 from typing import List, Dict
-from datetime import datetime
 
 from sources.base import BaseCrawler
-from utils import clean_text, parse_date, generate_article_id, categorize_article, is_einvoice_related
-from sources.ey import COUNTRY_KEYWORDS, REGION_MAPPING, COUNTRY_NAMES
+from utils import clean_text, parse_date, generate_article_id, css_select, css_select_one
+from sources.ey import ARTICLE_ANALYZER, COUNTRY_INFO, NO_COUNTRY
 
 
 class AvalaraCrawler(BaseCrawler):
@@ -30,21 +29,6 @@ class AvalaraCrawler(BaseCrawler):
     def base_url(self) -> str:
         return "https://www.avalara.com"
 
-    def detect_country(self, title: str, summary: str) -> tuple:
-        """Detect country from article content"""
-        text = (title + ' ' + summary).lower()
-
-        for country_code, keywords in COUNTRY_KEYWORDS.items():
-            for keyword in keywords:
-                if keyword in text:
-                    return (
-                        country_code,
-                        COUNTRY_NAMES.get(country_code),
-                        REGION_MAPPING.get(country_code, 'global')
-                    )
-
-        return (None, 'Global', 'global')
-
     def crawl(self) -> List[Dict]:
         """Crawl Avalara blog"""
         articles = []
@@ -55,62 +39,56 @@ class AvalaraCrawler(BaseCrawler):
         if not html_content:
             return articles
 
-        soup = self.parse_html(html_content)
+        tree = self.parse_html(html_content)
 
         # Find blog posts
-        news_items = soup.select('.blog-post, .post, article, .card, [class*="blog"]')
+        news_items = css_select(tree, '.blog-post, .post, article, .card, [class*="blog"]')
 
         for item in news_items[:25]:
             try:
                 # Extract title
-                title_elem = item.select_one('h2, h3, h4, .title, a[class*="title"]')
+                title_elem = css_select_one(item, 'h2, h3, h4, .title, a[class*="title"]')
                 if not title_elem:
                     continue
 
-                title = clean_text(title_elem.get_text())
+                title = clean_text(title_elem.text())
                 if not title or len(title) < 10:
                     continue
 
                 # Extract URL
-                link = item.select_one('a[href]')
-                url = ""
-                if link:
-                    url = link.get('href', '')
-                    if url and not url.startswith('http'):
-                        url = f"{self.base_url}{url}"
-
-                if not url:
+                link = css_select_one(item, 'a[href]')
+                url = self.resolve_href(link.attributes.get('href')) if link else None
+
+                if not url or self.is_known(url):
                     continue
 
                 # Extract date
-                date_elem = item.select_one('.date, time, [class*="date"]')
+                date_elem = css_select_one(item, '.date, time, [class*="date"]')
                 published_at = None
                 if date_elem:
-                    date_text = date_elem.get('datetime') or date_elem.get_text()
+                    date_text = date_elem.attributes.get('datetime') or date_elem.text()
                     published_at = parse_date(date_text)
 
                 if not published_at:
-                    published_at = datetime.utcnow()
+                    published_at = self.crawl_started_at
 
                 # Extract summary
                 summary = ""
-                summary_elem = item.select_one('.summary, .excerpt, p, [class*="desc"]')
+                summary_elem = css_select_one(item, '.summary, .excerpt, p, [class*="desc"]')
                 if summary_elem:
-                    summary = clean_text(summary_elem.get_text())[:300]
+                    summary = clean_text(summary_elem.text())[:300]
 
                 if not summary:
                     summary = title
 
-                # Check if e-invoice related
-                if not is_einvoice_related(title, summary):
+                # Check if e-invoice related, detect country and categorize
+                is_einvoice, country_code, categories = ARTICLE_ANALYZER.analyze(title, summary)
+                if not is_einvoice:
                     continue
 
-                # Detect country
-                country_code, country_name, region = self.detect_country(title, summary)
+                country_code, country_name, region = COUNTRY_INFO.get(country_code, NO_COUNTRY)
 
-                # Generate ID and categorize
                 article_id = generate_article_id(self.source_id, url, published_at)
-                categories = categorize_article(title, summary)
 
                 article = self.create_article(
                     article_id=article_id,
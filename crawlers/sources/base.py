@@ -2,41 +2,164 @@
 Base crawler class for all source crawlers
 """
 
+import os
+import re
 import time
 import logging
+import threading
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional
-from datetime import datetime
+from types import MappingProxyType
+from typing import List, Dict, Optional, Tuple, Union
+from datetime import datetime, timezone
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from requests_cache import CachedSession
 from urllib.parse import urlparse
-from bs4 import BeautifulSoup
-from ratelimit import limits, sleep_and_retry
+from selectolax.lexbor import LexborHTMLParser
+
+from sources.session_pool import SessionPool
+from sources.token_bucket import TokenBucket
+from utils import css_select
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Rate limit: 10 requests per minute per crawler
+# Rate limit: 10 requests per minute per host, shared by all crawlers. Bursts
+# of up to 10 go out at once, then requests are spaced at the refill rate
 CALLS_PER_MINUTE = 10
 RATE_PERIOD = 60
 
+# Keep-alive connections kept per host, and number of hosts whose connection
+# pools are kept open at once
+POOL_SIZE = 16
+HOST_POOLS = 32
+
+# Retry transient failures with exponential backoff (0.5s, 1s, 2s); the last
+# response is returned rather than raised so blocked sessions can be retired
+RETRY_STRATEGY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=[429, 500, 502, 503, 504],
+    raise_on_status=False,
+)
+
+# Responses that mean a session was blocked; the request is retried once
+# with a fresh session from the pool after retiring the blocked one
+BLOCKED_STATUS_CODES = (403, 429)
+BLOCKED_RETRIES = 1
+
+# HTTP response cache shared by all crawlers and kept between runs. Expired
+# pages are revalidated with ETag / Last-Modified instead of re-downloaded,
+# and a stale copy is served if the site is down.
+CACHE_PATH = Path(__file__).parent.parent / '.cache' / 'http'
+CACHE_EXPIRE_AFTER = 1800  # seconds
+
+# Responses smaller than this are block or error pages, not listings
+MIN_PAGE_SIZE = 512
+# Listings sit well inside this; anything past it is sidebars, inline
+# downloads or runaway markup, and is cut off before parsing
+MAX_PAGE_SIZE = 2 * 1024 * 1024
+
+# Charsets that can be handed to the parser as raw bytes
+UTF8_CHARSETS = ('utf-8', 'utf8', 'ascii', 'us-ascii')
+
+# Article URLs containing any of these are never usable links
+INVALID_URL_MARKERS = ('javascript:', 'mailto:', 'tel:', '#', 'void(')
+
+# Listing hrefs that never lead to an article page
+SKIP_HREF_PREFIXES = ('javascript:', '#', 'mailto:')
+
+# Plain http(s) URLs whose host urlparse() would return unchanged; group 1 is
+# the netloc. Anything else (stray whitespace, IPv6 hosts, other schemes)
+# falls back to urlparse()
+HTTP_URL_RE = re.compile(r'https?://([^/?#\[\]\s]*)(?:[/?#][^\t\r\n]*)?\Z', re.IGNORECASE)
+
+# Maximum number of pages a single crawler fetches at the same time
+MAX_CONCURRENT_FETCHES = 4
+
+# Maximum concurrent requests to any one host, across all crawlers
+MAX_PER_HOST = 2
+
+
+def concurrency_limit(default: int) -> int:
+    """Read CRAWL_CONCURRENCY: default when unset or not an integer, and at least 1"""
+    value = os.environ.get('CRAWL_CONCURRENCY')
+    if value is None:
+        return default
+    try:
+        limit = int(value)
+    except ValueError:
+        logger.warning(f"Ignoring invalid CRAWL_CONCURRENCY={value!r}; using {default}")
+        return default
+    if limit < 1:
+        logger.warning(f"CRAWL_CONCURRENCY={limit} is below 1; using 1")
+        return 1
+    return limit
+
+
+# Maximum requests in flight across all crawlers and hosts; override with
+# the CRAWL_CONCURRENCY environment variable
+MAX_IN_FLIGHT = concurrency_limit(POOL_SIZE)
+_in_flight = threading.BoundedSemaphore(MAX_IN_FLIGHT)
+
+_host_semaphores: Dict[str, threading.Semaphore] = {}
+_host_semaphores_lock = threading.Lock()
+
+
+def host_semaphore(url: str) -> threading.Semaphore:
+    """Return the shared semaphore limiting concurrent requests to a URL's host"""
+    host = urlparse(url).netloc.lower()
+    with _host_semaphores_lock:
+        if host not in _host_semaphores:
+            _host_semaphores[host] = threading.Semaphore(MAX_PER_HOST)
+        return _host_semaphores[host]
+
+
+_host_rate_limiters: Dict[str, TokenBucket] = {}
+_host_rate_limiters_lock = threading.Lock()
+
+
+def wait_for_rate_limit(url: str) -> None:
+    """Block until another request to the URL's host fits in its rate limit"""
+    host = urlparse(url).netloc.lower()
+    with _host_rate_limiters_lock:
+        if host not in _host_rate_limiters:
+            _host_rate_limiters[host] = TokenBucket(
+                rate=CALLS_PER_MINUTE / RATE_PERIOD, capacity=CALLS_PER_MINUTE
+            )
+        limiter = _host_rate_limiters[host]
+    limiter.acquire()
+
 
 class BaseCrawler(ABC):
     """Abstract base class for all source crawlers"""
 
-    # Default headers to mimic a browser
-    DEFAULT_HEADERS = {
+    # Default headers to mimic a browser; read-only, copied into each pooled session
+    DEFAULT_HEADERS = MappingProxyType({
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
         'Accept-Language': 'en-US,en;q=0.5',
         'Accept-Encoding': 'gzip, deflate, br',
         'Connection': 'keep-alive',
-    }
+    })
 
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update(self.DEFAULT_HEADERS)
+        self.session_pool = session_pool
+        # URLs of articles already stored from earlier runs; set by the orchestrator
+        self.known_urls = frozenset()
+        # Pages fetched by this crawl; articles linking to one are re-collected
+        self.fetched_urls = set()
+        self._start_clock()
+
+    def _start_clock(self):
+        """Take the timestamp stamped as crawledAt on every article of this crawl"""
+        self.crawl_started_at = datetime.now(timezone.utc)
+        self._crawled_at_iso = self.crawl_started_at.isoformat()
 
     @property
     @abstractmethod
@@ -77,9 +200,7 @@ class BaseCrawler(ABC):
         """Default country name for articles from this source"""
         return None
 
-    @sleep_and_retry
-    @limits(calls=CALLS_PER_MINUTE, period=RATE_PERIOD)
-    def fetch_page(self, url: str, timeout: int = 30) -> Optional[str]:
+    def fetch_page(self, url: str, timeout: int = 30) -> Optional[bytes]:
         """
         Fetch a page with rate limiting
 
@@ -88,20 +209,82 @@ class BaseCrawler(ABC):
             timeout: Request timeout in seconds
 
         Returns:
-            HTML content or None if failed
+            UTF-8 encoded HTML content cut to MAX_PAGE_SIZE, or None if failed or too small to be a real page
         """
+        self.fetched_urls.add(url)
         try:
             logger.info(f"Fetching: {url}")
-            response = self.session.get(url, timeout=timeout)
+            for attempt in range(BLOCKED_RETRIES + 1):
+                session = self.session_pool.get()
+                wait_for_rate_limit(url)
+                # Take the host slot first so a queued request never holds a global one
+                with host_semaphore(url), _in_flight:
+                    response = session.get(url, timeout=timeout)
+                if response.status_code not in BLOCKED_STATUS_CODES:
+                    break
+                self.session_pool.retire(session)
             response.raise_for_status()
-            return response.text
+
+            content = response.content
+            if len(content) < MIN_PAGE_SIZE:
+                logger.warning(f"Skipping {url}: response too small ({len(content)} bytes)")
+                return None
+
+            # The parser reads bytes as UTF-8; only re-encode pages that declare another charset
+            if 'charset=' in response.headers.get('Content-Type', '').lower() \
+                    and response.encoding.lower().replace('_', '-') not in UTF8_CHARSETS:
+                content = response.text.encode('utf-8')
+            if len(content) > MAX_PAGE_SIZE:
+                logger.warning(f"Truncating {url}: {len(content)} bytes exceeds {MAX_PAGE_SIZE}")
+                content = content[:MAX_PAGE_SIZE]
+            return content
         except requests.RequestException as e:
             logger.error(f"Failed to fetch {url}: {e}")
             return None
 
-    def parse_html(self, html_content: str) -> BeautifulSoup:
-        """Parse HTML content into BeautifulSoup object"""
-        return BeautifulSoup(html_content, 'lxml')
+    def fetch_pages(self, urls: List[str], timeout: int = 30) -> List[Tuple[str, Optional[bytes]]]:
+        """
+        Fetch several pages concurrently
+
+        Args:
+            urls: URLs to fetch
+            timeout: Request timeout in seconds
+
+        Returns:
+            List of (url, HTML content or None) pairs, in the same order as urls
+        """
+        if len(urls) <= 1:
+            return [(url, self.fetch_page(url, timeout)) for url in urls]
+
+        workers = min(len(urls), MAX_CONCURRENT_FETCHES)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pages = executor.map(lambda url: self.fetch_page(url, timeout), urls)
+            return list(zip(urls, pages))
+
+    def parse_html(self, html_content: Union[bytes, str]) -> LexborHTMLParser:
+        """Parse HTML content into a lexbor tree (script and style content removed)"""
+        tree = LexborHTMLParser(html_content)
+        tree.strip_tags(['script', 'style'])
+        return tree
+
+    def select_items(self, tree, page_url: str, selectors, min_items: int = 1) -> list:
+        """
+        Find the listing items on a page using the first selector that matches enough
+
+        Args:
+            tree: Parsed page
+            page_url: URL the page was fetched from
+            selectors: Candidate selectors, in order of preference
+            min_items: Fewest matches a selector needs to be accepted
+
+        Returns:
+            Matching items, or an empty list if no selector matched enough
+        """
+        for selector in selectors:
+            found = css_select(tree, selector)
+            if len(found) >= min_items:
+                return found
+        return []
 
     @abstractmethod
     def crawl(self) -> List[Dict]:
@@ -139,6 +322,10 @@ class BaseCrawler(ABC):
         country_name: str = None
     ) -> Dict:
         """Create a standardized article dictionary"""
+        # Dates scraped without an offset are taken as UTC, so every publishedAt carries one
+        if published_at and published_at.tzinfo is None:
+            published_at = published_at.replace(tzinfo=timezone.utc)
+
         return {
             'id': article_id,
             'title': title,
@@ -153,8 +340,8 @@ class BaseCrawler(ABC):
             'country': country or self.country,
             'countryName': country_name or self.country_name,
             'categories': categories,
-            'publishedAt': published_at.isoformat() if published_at else datetime.utcnow().isoformat(),
-            'crawledAt': datetime.utcnow().isoformat()
+            'publishedAt': published_at.isoformat() if published_at else self._crawled_at_iso,
+            'crawledAt': self._crawled_at_iso
         }
 
     def is_valid_url(self, url: str) -> bool:
@@ -166,10 +353,15 @@ class BaseCrawler(ABC):
             return False
 
         # Check for invalid schemes
-        invalid_prefixes = ('javascript:', 'mailto:', 'tel:', '#', 'void(')
-        if any(url.lower().startswith(prefix) or prefix in url.lower() for prefix in invalid_prefixes):
+        lowered = url.lower()
+        if any(marker in lowered for marker in INVALID_URL_MARKERS):
             return False
 
+        # Fast path for ordinary http(s) URLs
+        match = HTTP_URL_RE.match(url)
+        if match and url[-1] > ' ':
+            return '.' in match.group(1)
+
         # Parse and validate URL structure
         try:
             parsed = urlparse(url)
@@ -182,20 +374,73 @@ class BaseCrawler(ABC):
         except Exception:
             return False
 
+    def resolve_href(self, href: str) -> Optional[str]:
+        """Return a listing href as an absolute URL, or None if it is not a page link"""
+        if not href or href.startswith(SKIP_HREF_PREFIXES):
+            return None
+        if href.startswith('http'):
+            return href
+        return f"{self.base_url}{href}"
+
+    def is_known(self, url: str) -> bool:
+        """
+        Check if an article URL was already collected in an earlier run
+
+        Articles whose URL is a page fetched in this crawl (a listing or
+        country page standing in for the article) are never known, so their
+        fresh copy replaces the stored one and content changes show up.
+        """
+        return url in self.known_urls and url not in self.fetched_urls
+
     def safe_crawl(self) -> List[Dict]:
         """Wrapper around crawl with error handling and URL validation"""
+        self._start_clock()
+        self.fetched_urls = set()
         try:
             articles = self.crawl()
-            # Filter out articles with invalid URLs
+            # Filter out articles with invalid URLs and ones stored by earlier runs
             valid_articles = []
+            known = 0
             for article in articles:
-                if self.is_valid_url(article.get('url', '')):
+                if self.is_known(article.get('url', '')):
+                    known += 1
+                elif self.is_valid_url(article.get('url', '')):
                     valid_articles.append(article)
                 else:
                     logger.warning(f"{self.source_name}: Skipping article with invalid URL: {article.get('url', 'N/A')}")
 
-            logger.info(f"{self.source_name}: Found {len(valid_articles)} valid articles (filtered {len(articles) - len(valid_articles)} invalid)")
+            logger.info(f"{self.source_name}: Found {len(valid_articles)} valid articles (filtered {len(articles) - len(valid_articles) - known} invalid, {known} already known)")
             return valid_articles
         except Exception as e:
             logger.error(f"{self.source_name}: Crawl failed - {e}")
             return []
+
+
+# One adapter (and so one set of keep-alive connections per host) shared by
+# every session in the pool; rotating sessions does not cost new handshakes
+_adapter = HTTPAdapter(
+    pool_connections=HOST_POOLS,
+    pool_maxsize=POOL_SIZE,
+    max_retries=RETRY_STRATEGY
+)
+
+
+def create_session(user_agent: str) -> CachedSession:
+    """Create a cached, retrying session for the session pool"""
+    session = CachedSession(
+        str(CACHE_PATH),
+        backend='sqlite',
+        expire_after=CACHE_EXPIRE_AFTER,
+        cache_control=True,
+        stale_if_error=True,
+        wal=True
+    )
+    session.headers.update(BaseCrawler.DEFAULT_HEADERS)
+    session.headers['User-Agent'] = user_agent
+    session.mount('http://', _adapter)
+    session.mount('https://', _adapter)
+    return session
+
+
+# Sessions shared by all crawlers for the whole run
+session_pool = SessionPool(create_session)
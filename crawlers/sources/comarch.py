@@ -4,10 +4,9 @@ Crawls e-invoicing country updates from Comarch
 """
 
 from typing import List, Dict
-from datetime import datetime
 
 from sources.base import BaseCrawler
-from utils import clean_text, parse_date, generate_article_id, categorize_article
+from utils import clean_text, parse_date, generate_article_id, css_select, css_select_one, ArticleAnalyzer
 
 # Country detection
 COUNTRY_KEYWORDS = {
@@ -43,6 +42,36 @@ COUNTRY_NAMES = {
     'IN': 'India', 'MY': 'Malaysia', 'PH': 'Philippines',
 }
 
+# (code, name, region) for each country, built once; NO_COUNTRY when none matches
+COUNTRY_INFO = {
+    code: (code, COUNTRY_NAMES.get(code), REGION_MAPPING.get(code, 'global'))
+    for code in COUNTRY_KEYWORDS
+}
+NO_COUNTRY = (None, 'Global', 'global')
+
+# Listing item selectors, tried in order until one matches more than two items
+ITEM_SELECTORS = (
+    'article',
+    '.news-item',
+    '.regulation-item',
+    '.card',
+    '[class*="item"]',
+    '.post',
+)
+# Fallback when no listing items are found: links into the regulation pages
+LINK_FALLBACK_SELECTOR = 'a[href*="legal-regulation"], a[href*="e-invoicing"], a[href*="e-receipt"]'
+TITLE_SELECTOR = 'h2, h3, h4, a, .title'
+DATE_SELECTOR = '.date, time, [class*="date"]'
+SUMMARY_SELECTOR = 'p, .excerpt, .summary'
+
+# Filter for e-invoicing content
+EINVOICE_KEYWORDS = [
+    'e-invoice', 'einvoice', 'e-receipt', 'electronic invoice', 'vat', 'tax', 'mandate',
+]
+
+# E-invoice filter, country detection and categories in one pass over the text
+ARTICLE_ANALYZER = ArticleAnalyzer(COUNTRY_KEYWORDS, einvoice_keywords=EINVOICE_KEYWORDS)
+
 
 class ComarchCrawler(BaseCrawler):
     """Crawler for Comarch Legal Regulation Changes"""
@@ -63,21 +92,10 @@ class ComarchCrawler(BaseCrawler):
     def base_url(self) -> str:
         return "https://www.comarch.com"
 
-    def detect_country(self, title: str, summary: str) -> tuple:
-        text = (title + ' ' + summary).lower()
-        for country_code, keywords in COUNTRY_KEYWORDS.items():
-            for keyword in keywords:
-                if keyword in text:
-                    return (
-                        country_code,
-                        COUNTRY_NAMES.get(country_code),
-                        REGION_MAPPING.get(country_code, 'global')
-                    )
-        return (None, 'Global', 'global')
-
     def crawl(self) -> List[Dict]:
         """Crawl Comarch legal regulation changes"""
         articles = []
+        seen_urls = set()
 
         news_url = f"{self.base_url}/trade-and-services/data-management/legal-regulation-changes"
         html_content = self.fetch_page(news_url)
@@ -85,78 +103,59 @@ class ComarchCrawler(BaseCrawler):
         if not html_content:
             return articles
 
-        soup = self.parse_html(html_content)
+        tree = self.parse_html(html_content)
 
         # Find article/news items
-        selectors = [
-            'article',
-            '.news-item',
-            '.regulation-item',
-            '.card',
-            '[class*="item"]',
-            '.post',
-        ]
-
-        items = []
-        for selector in selectors:
-            found = soup.select(selector)
-            if found and len(found) > 2:
-                items = found
-                break
+        items = self.select_items(tree, news_url, ITEM_SELECTORS, min_items=3)
 
         # Also try links in main content
         if not items:
-            items = soup.select('a[href*="legal-regulation"], a[href*="e-invoicing"], a[href*="e-receipt"]')
+            items = css_select(tree, LINK_FALLBACK_SELECTOR)
 
         for item in items[:25]:
             try:
                 # Extract title
-                if item.name == 'a':
-                    title = clean_text(item.get_text())
-                    url = item.get('href', '')
+                if item.tag == 'a':
+                    title = clean_text(item.text())
+                    url = self.resolve_href(item.attributes.get('href'))
                 else:
-                    title_elem = item.select_one('h2, h3, h4, a, .title')
+                    title_elem = css_select_one(item, TITLE_SELECTOR)
                     if not title_elem:
                         continue
-                    title = clean_text(title_elem.get_text())
+                    title = clean_text(title_elem.text())
 
-                    link = item.select_one('a[href]')
-                    url = link.get('href', '') if link else ''
+                    link = css_select_one(item, 'a[href]')
+                    url = self.resolve_href(link.attributes.get('href')) if link else None
 
                 if not title or len(title) < 15:
                     continue
 
-                if url and not url.startswith('http'):
-                    url = f"{self.base_url}{url}"
-
                 if not url:
                     continue
 
                 # Extract date
-                date_elem = item.select_one('.date, time, [class*="date"]') if item.name != 'a' else None
-                published_at = datetime.utcnow()
+                date_elem = css_select_one(item, DATE_SELECTOR) if item.tag != 'a' else None
+                published_at = self.crawl_started_at
                 if date_elem:
-                    parsed = parse_date(date_elem.get_text())
+                    parsed = parse_date(date_elem.text())
                     if parsed:
                         published_at = parsed
 
                 # Extract summary
                 summary = title
-                if item.name != 'a':
-                    summary_elem = item.select_one('p, .excerpt, .summary')
+                if item.tag != 'a':
+                    summary_elem = css_select_one(item, SUMMARY_SELECTOR)
                     if summary_elem:
-                        summary = clean_text(summary_elem.get_text())[:300]
+                        summary = clean_text(summary_elem.text())[:300]
 
-                # Filter for e-invoicing content
-                einvoice_keywords = ['e-invoice', 'einvoice', 'e-receipt', 'electronic invoice', 'vat', 'tax', 'mandate']
-                if not any(kw in (title + summary).lower() for kw in einvoice_keywords):
+                # Filter for e-invoicing content, detect country and categorize
+                is_einvoice, country_code, categories = ARTICLE_ANALYZER.analyze(title, summary)
+                if not is_einvoice:
                     continue
 
-                # Detect country
-                country_code, country_name, region = self.detect_country(title, summary)
+                country_code, country_name, region = COUNTRY_INFO.get(country_code, NO_COUNTRY)
 
                 article_id = generate_article_id(self.source_id, url, published_at)
-                categories = categorize_article(title, summary)
 
                 article = self.create_article(
                     article_id=article_id,
@@ -170,7 +169,8 @@ class ComarchCrawler(BaseCrawler):
                     country_name=country_name
                 )
 
-                if not any(a['url'] == url for a in articles):
+                if url not in seen_urls:
+                    seen_urls.add(url)
                     articles.append(article)
 
             except Exception:
@@ -4,10 +4,43 @@ Crawls official e-invoicing news from invoicing.eta.gov.eg
 """
 
 from typing import List, Dict
-from datetime import datetime
 
 from sources.base import BaseCrawler
-from utils import clean_text, parse_date, generate_article_id, categorize_article
+from utils import clean_text, parse_date, generate_article_id, css_select, css_select_one, ArticleAnalyzer
+
+
+# Listing item selectors, tried in order until one matches more than one item
+ITEM_SELECTORS = (
+    'article',
+    '.news-item',
+    '.announcement',
+    '.update-item',
+    '[class*="news"]',
+    '[class*="announcement"]',
+    '.card',
+    '.list-item',
+    'table tr',
+    '.post',
+)
+TITLE_SELECTOR = 'a, h2, h3, h4, .title, td:first-child'
+SUMMARY_SELECTOR = 'p, .summary, .description, .excerpt'
+DATE_SELECTOR = 'time, .date, [class*="date"], td:last-child'
+
+# Broad filter for bare links when no listing items are found; the analyzers
+# apply a filter and categorize in one pass over the text
+LINK_ANALYZER = ArticleAnalyzer(einvoice_keywords=[
+    'invoice', 'e-invoice', 'einvoice', 'فاتورة',
+    'tax', 'vat', 'electronic', 'digital',
+    'compliance', 'mandate', 'registration',
+    'update', 'news', 'announcement', 'deadline',
+])
+
+# Filter for e-invoice/tax related listing items (title + summary)
+ITEM_ANALYZER = ArticleAnalyzer(einvoice_keywords=[
+    'invoice', 'e-invoice', 'einvoice', 'فاتورة',
+    'tax', 'vat', 'electronic', 'compliance',
+    'mandate', 'registration', 'b2b', 'b2c',
+])
 
 
 class EgyptETACrawler(BaseCrawler):
@@ -44,6 +77,7 @@ class EgyptETACrawler(BaseCrawler):
     def crawl(self) -> List[Dict]:
         """Crawl Egypt ETA e-invoicing portal"""
         articles = []
+        seen_titles = set()
 
         # ETA has multiple potential news/updates URLs
         urls_to_crawl = [
@@ -55,61 +89,37 @@ class EgyptETACrawler(BaseCrawler):
             "https://www.eta.gov.eg/ar/news",
         ]
 
-        for page_url in urls_to_crawl:
-            html_content = self.fetch_page(page_url)
+        for page_url, html_content in self.fetch_pages(urls_to_crawl):
             if not html_content:
                 continue
 
-            soup = self.parse_html(html_content)
+            tree = self.parse_html(html_content)
 
             # Try various common selectors for news items
-            selectors = [
-                'article',
-                '.news-item',
-                '.announcement',
-                '.update-item',
-                '[class*="news"]',
-                '[class*="announcement"]',
-                '.card',
-                '.list-item',
-                'table tr',
-                '.post',
-            ]
-
-            items = []
-            for selector in selectors:
-                found = soup.select(selector)
-                if found and len(found) > 1:
-                    items = found
-                    break
+            items = self.select_items(tree, page_url, ITEM_SELECTORS, min_items=2)
 
             # If no structured items found, try to extract from any visible text
             if not items:
                 # Look for any links with relevant keywords
-                links = soup.select('a[href]')
+                links = css_select(tree, 'a[href]')
                 for link in links[:30]:
                     try:
-                        text = clean_text(link.get_text())
-                        href = link.get('href', '')
+                        text = clean_text(link.text())
+                        href = link.attributes.get('href') or ''
 
                         if not text or len(text) < 15:
                             continue
 
-                        # Filter for relevant content
-                        einvoice_keywords = [
-                            'invoice', 'e-invoice', 'einvoice', 'فاتورة',
-                            'tax', 'vat', 'electronic', 'digital',
-                            'compliance', 'mandate', 'registration',
-                            'update', 'news', 'announcement', 'deadline',
-                        ]
-
-                        if not any(kw in text.lower() for kw in einvoice_keywords):
+                        # Filter for relevant content and categorize
+                        is_relevant, _, categories = LINK_ANALYZER.analyze(text, text)
+                        if not is_relevant:
                             continue
 
-                        url = href if href.startswith('http') else f"{self.base_url}{href}"
+                        url = self.resolve_href(href)
+                        if not url:
+                            continue
 
-                        article_id = generate_article_id(self.source_id, url, datetime.utcnow())
-                        categories = categorize_article(text, text)
+                        article_id = generate_article_id(self.source_id, url, self.crawl_started_at)
 
                         article = self.create_article(
                             article_id=article_id,
@@ -117,10 +127,11 @@ class EgyptETACrawler(BaseCrawler):
                             summary=f"Official update from Egypt Tax Authority: {text}",
                             url=url,
                             categories=categories,
-                            published_at=datetime.utcnow()
+                            published_at=self.crawl_started_at
                         )
 
-                        if not any(a['title'] == text for a in articles):
+                        if text not in seen_titles:
+                            seen_titles.add(text)
                             articles.append(article)
 
                     except Exception:
@@ -131,57 +142,46 @@ class EgyptETACrawler(BaseCrawler):
             for item in items[:20]:
                 try:
                     # Skip header rows
-                    if item.select_one('th'):
+                    if css_select_one(item, 'th'):
                         continue
 
                     # Extract title
-                    title_elem = item.select_one('a, h2, h3, h4, .title, td:first-child')
+                    title_elem = css_select_one(item, TITLE_SELECTOR)
                     if not title_elem:
                         continue
 
-                    title = clean_text(title_elem.get_text())
+                    title = clean_text(title_elem.text())
                     if not title or len(title) < 10:
                         continue
 
                     # Extract URL
-                    link = item.select_one('a[href]')
-                    url = page_url
-                    if link:
-                        href = link.get('href', '')
-                        if href:
-                            url = href if href.startswith('http') else f"{self.base_url}{href}"
+                    link = css_select_one(item, 'a[href]')
+                    url = (self.resolve_href(link.attributes.get('href')) if link else None) or page_url
 
                     # Extract summary
-                    summary_elem = item.select_one('p, .summary, .description, .excerpt')
+                    summary_elem = css_select_one(item, SUMMARY_SELECTOR)
                     summary = title
                     if summary_elem:
-                        summary_text = clean_text(summary_elem.get_text())
+                        summary_text = clean_text(summary_elem.text())
                         if summary_text and len(summary_text) > 20:
                             summary = summary_text
 
                     # Extract date
-                    date_elem = item.select_one('time, .date, [class*="date"], td:last-child')
-                    published_at = datetime.utcnow()
+                    date_elem = css_select_one(item, DATE_SELECTOR)
+                    published_at = self.crawl_started_at
                     if date_elem:
-                        date_text = date_elem.get('datetime') or date_elem.get_text()
+                        date_text = date_elem.attributes.get('datetime') or date_elem.text()
                         parsed = parse_date(date_text)
                         if parsed:
                             published_at = parsed
 
-                    # Filter for e-invoice/tax related content
-                    einvoice_keywords = [
-                        'invoice', 'e-invoice', 'einvoice', 'فاتورة',
-                        'tax', 'vat', 'electronic', 'compliance',
-                        'mandate', 'registration', 'b2b', 'b2c',
-                    ]
-
-                    content_lower = (title + ' ' + summary).lower()
-                    if not any(kw in content_lower for kw in einvoice_keywords):
+                    # Filter for e-invoice/tax related content and categorize
+                    is_relevant, _, categories = ITEM_ANALYZER.analyze(title, summary)
+                    if not is_relevant:
                         continue
 
                     # Generate article
                     article_id = generate_article_id(self.source_id, url, published_at)
-                    categories = categorize_article(title, summary)
 
                     article = self.create_article(
                         article_id=article_id,
@@ -192,7 +192,8 @@ class EgyptETACrawler(BaseCrawler):
                         published_at=published_at
                     )
 
-                    if not any(a['title'] == title for a in articles):
+                    if title not in seen_titles:
+                        seen_titles.add(title)
                         articles.append(article)
 
                 except Exception:
@@ -4,14 +4,14 @@ Crawls tax news and alerts from EY website
 """
 
 from typing import List, Dict, Optional
-from datetime import datetime
 import re
 
 from sources.base import BaseCrawler
-from utils import clean_text, parse_date, generate_article_id, categorize_article, is_einvoice_related
+from utils import clean_text, parse_date, generate_article_id, css_select_one, ArticleAnalyzer
 
 
-# Country mapping for EY articles based on keywords
+# Country mapping for EY articles based on keywords; short acronyms are
+# padded with spaces so they only match as whole words
 COUNTRY_KEYWORDS = {
     'SA': ['saudi', 'zatca', 'kingdom of saudi arabia', 'ksa'],
     'AE': ['uae', 'emirates', 'dubai', 'abu dhabi', 'fta'],
@@ -21,11 +21,11 @@ COUNTRY_KEYWORDS = {
     'QA': ['qatar', 'qatari'],
     'KW': ['kuwait', 'kuwaiti'],
     'JO': ['jordan', 'jordanian'],
-    'EU': ['european union', 'eu ', 'vida', 'european commission'],
+    'EU': ['european union', ' eu ', 'vida', 'european commission'],
     'DE': ['germany', 'german', 'xrechnung'],
     'FR': ['france', 'french', 'chorus pro'],
-    'IT': ['italy', 'italian', 'sdi '],
-    'ES': ['spain', 'spanish', 'sii ', 'ticketbai'],
+    'IT': ['italy', 'italian', ' sdi '],
+    'ES': ['spain', 'spanish', ' sii ', 'ticketbai'],
     'PL': ['poland', 'polish', 'ksef'],
     'IN': ['india', 'indian', 'gst', 'gstn'],
     'BR': ['brazil', 'brazilian', 'nf-e', 'nfe'],
@@ -51,6 +51,26 @@ COUNTRY_NAMES = {
     'IN': 'India', 'BR': 'Brazil', 'MX': 'Mexico',
 }
 
+# (code, name, region) for each country, built once; NO_COUNTRY when none matches
+COUNTRY_INFO = {
+    code: (code, COUNTRY_NAMES.get(code), REGION_MAPPING.get(code, 'global'))
+    for code in COUNTRY_KEYWORDS
+}
+NO_COUNTRY = (None, 'Global', 'global')
+
+# E-invoice check, country detection and categories in one pass over the text
+ARTICLE_ANALYZER = ArticleAnalyzer(COUNTRY_KEYWORDS)
+
+# Listing item selectors, tried in order until one matches
+ITEM_SELECTORS = (
+    '.ey-card', '.article-card', '.insight-card',
+    '[class*="card"]', 'article', '.item'
+)
+TITLE_SELECTOR = 'h2, h3, h4, .title, [class*="title"]'
+LINK_SELECTOR = 'a[href]'
+DATE_SELECTOR = '.date, time, [class*="date"], [class*="time"]'
+SUMMARY_SELECTOR = '.summary, .description, .excerpt, p, [class*="desc"]'
+
 
 class EYCrawler(BaseCrawler):
     """Crawler for EY Tax Alerts"""
@@ -71,21 +91,6 @@ class EYCrawler(BaseCrawler):
     def base_url(self) -> str:
         return "https://www.ey.com"
 
-    def detect_country(self, title: str, summary: str) -> tuple:
-        """Detect country from article content"""
-        text = (title + ' ' + summary).lower()
-
-        for country_code, keywords in COUNTRY_KEYWORDS.items():
-            for keyword in keywords:
-                if keyword in text:
-                    return (
-                        country_code,
-                        COUNTRY_NAMES.get(country_code),
-                        REGION_MAPPING.get(country_code, 'global')
-                    )
-
-        return (None, 'Global', 'global')
-
     def crawl(self) -> List[Dict]:
         """Crawl EY tax alerts"""
         articles = []
@@ -103,77 +108,60 @@ class EYCrawler(BaseCrawler):
         else:
             return articles
 
-        soup = self.parse_html(html_content)
+        tree = self.parse_html(html_content)
 
         # Find article items
-        article_selectors = [
-            '.ey-card', '.article-card', '.insight-card',
-            '[class*="card"]', 'article', '.item'
-        ]
-
-        news_items = []
-        for selector in article_selectors:
-            items = soup.select(selector)
-            if items:
-                news_items = items
-                break
+        news_items = self.select_items(tree, news_url, ITEM_SELECTORS)
 
         for item in news_items[:30]:
             try:
-                # Extract title
-                title_elem = item.select_one('h2, h3, h4, .title, [class*="title"]')
+                # Extract title, falling back to the item's link text
+                link = css_select_one(item, LINK_SELECTOR)
+                title_elem = css_select_one(item, TITLE_SELECTOR)
                 if not title_elem:
-                    link = item.select_one('a[href]')
-                    if link:
-                        title_elem = link
+                    title_elem = link
 
                 if not title_elem:
                     continue
 
-                title = clean_text(title_elem.get_text())
+                title = clean_text(title_elem.text())
                 if not title or len(title) < 15:
                     continue
 
                 # Extract URL
-                link = item.select_one('a[href]')
-                url = ""
-                if link:
-                    url = link.get('href', '')
-                    if url and not url.startswith('http'):
-                        url = f"{self.base_url}{url}"
+                url = self.resolve_href(link.attributes.get('href')) if link else None
 
                 if not url:
                     continue
 
                 # Extract date
-                date_elem = item.select_one('.date, time, [class*="date"], [class*="time"]')
+                date_elem = css_select_one(item, DATE_SELECTOR)
                 published_at = None
                 if date_elem:
-                    date_text = date_elem.get('datetime') or date_elem.get_text()
+                    date_text = date_elem.attributes.get('datetime') or date_elem.text()
                     published_at = parse_date(date_text)
 
                 if not published_at:
-                    published_at = datetime.utcnow()
+                    published_at = self.crawl_started_at
 
                 # Extract summary
                 summary = ""
-                summary_elem = item.select_one('.summary, .description, .excerpt, p, [class*="desc"]')
+                summary_elem = css_select_one(item, SUMMARY_SELECTOR)
                 if summary_elem:
-                    summary = clean_text(summary_elem.get_text())[:300]
+                    summary = clean_text(summary_elem.text())[:300]
 
                 if not summary:
                     summary = title
 
-                # Check if e-invoice related
-                if not is_einvoice_related(title, summary):
+                # Check if e-invoice related, detect country and categorize
+                is_einvoice, country_code, categories = ARTICLE_ANALYZER.analyze(title, summary)
+                if not is_einvoice:
                     continue
 
-                # Detect country
-                country_code, country_name, region = self.detect_country(title, summary)
+                country_code, country_name, region = COUNTRY_INFO.get(country_code, NO_COUNTRY)
 
-                # Generate ID and categorize
+                # Generate ID
                 article_id = generate_article_id(self.source_id, url, published_at)
-                categories = categorize_article(title, summary)
 
                 article = self.create_article(
                     article_id=article_id,
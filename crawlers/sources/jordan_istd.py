@@ -5,10 +5,45 @@ Jordan's e-invoicing system is called "JoFotara"
 """
 
 from typing import List, Dict
-from datetime import datetime
 
 from sources.base import BaseCrawler
-from utils import clean_text, parse_date, generate_article_id, categorize_article
+from utils import clean_text, parse_date, generate_article_id, categorize_article, KeywordMatcher, css_select, css_select_one
+
+
+# Broad filter for bare links when no listing items are found
+LINK_KEYWORDS = KeywordMatcher([
+    'invoice', 'e-invoice', 'einvoice', 'jofotara', 'فاتورة',
+    'tax', 'vat', 'sales tax', 'income tax',
+    'electronic', 'digital', 'compliance', 'mandate',
+    'registration', 'update', 'news', 'announcement',
+])
+
+# Filter for listing items (title + summary)
+ITEM_KEYWORDS = KeywordMatcher([
+    'invoice', 'e-invoice', 'einvoice', 'jofotara',
+    'tax', 'vat', 'electronic', 'compliance',
+    'mandate', 'registration', 'b2b', 'b2c',
+])
+
+# Listing item selectors, tried in order until one matches more than one item
+ITEM_SELECTORS = (
+    'article',
+    '.news-item',
+    '.news-card',
+    '.announcement',
+    '[class*="news"]',
+    '[class*="announcement"]',
+    '.card',
+    '.list-item',
+    '.entry',
+    '.post',
+    'table tr',
+    '.ms-rtestate-field',  # SharePoint
+)
+LINK_SELECTOR = 'a[href]'
+TITLE_SELECTOR = 'a, h2, h3, h4, .title, td:first-child'
+SUMMARY_SELECTOR = 'p, .summary, .description, .excerpt'
+DATE_SELECTOR = 'time, .date, [class*="date"], td:last-child'
 
 
 class JordanISTDCrawler(BaseCrawler):
@@ -45,6 +80,7 @@ class JordanISTDCrawler(BaseCrawler):
     def crawl(self) -> List[Dict]:
         """Crawl Jordan ISTD news and announcements"""
         articles = []
+        seen_titles = set()
 
         # ISTD URLs - Arabic site structure
         urls_to_crawl = [
@@ -54,63 +90,36 @@ class JordanISTDCrawler(BaseCrawler):
             f"{self.base_url}/",                           # Homepage
         ]
 
-        for page_url in urls_to_crawl:
-            html_content = self.fetch_page(page_url)
+        for page_url, html_content in self.fetch_pages(urls_to_crawl):
             if not html_content:
                 continue
 
-            soup = self.parse_html(html_content)
+            tree = self.parse_html(html_content)
 
             # Try various common selectors for news items
-            selectors = [
-                'article',
-                '.news-item',
-                '.news-card',
-                '.announcement',
-                '[class*="news"]',
-                '[class*="announcement"]',
-                '.card',
-                '.list-item',
-                '.entry',
-                '.post',
-                'table tr',
-                '.ms-rtestate-field',  # SharePoint
-            ]
-
-            items = []
-            for selector in selectors:
-                found = soup.select(selector)
-                if found and len(found) > 1:
-                    items = found
-                    break
+            items = self.select_items(tree, page_url, ITEM_SELECTORS, min_items=2)
 
             # If no structured items, look for links
             if not items:
-                links = soup.select('a[href]')
+                links = css_select(tree, LINK_SELECTOR)
                 for link in links[:30]:
                     try:
-                        text = clean_text(link.get_text())
-                        href = link.get('href', '')
+                        text = clean_text(link.text())
 
                         if not text or len(text) < 15:
                             continue
 
-                        if href.startswith(('javascript:', '#', 'mailto:')):
+                        url = self.resolve_href(link.attributes.get('href'))
+                        if not url:
                             continue
 
-                        keywords = [
-                            'invoice', 'e-invoice', 'einvoice', 'jofotara', 'فاتورة',
-                            'tax', 'vat', 'sales tax', 'income tax',
-                            'electronic', 'digital', 'compliance', 'mandate',
-                            'registration', 'update', 'news', 'announcement',
-                        ]
-
-                        if not any(kw in text.lower() for kw in keywords):
+                        if not LINK_KEYWORDS.matches(text.lower()):
                             continue
 
-                        url = href if href.startswith('http') else f"{self.base_url}{href}"
+                        if self.is_known(url):
+                            continue
 
-                        article_id = generate_article_id(self.source_id, url, datetime.utcnow())
+                        article_id = generate_article_id(self.source_id, url, self.crawl_started_at)
                         categories = categorize_article(text, text)
 
                         article = self.create_article(
@@ -119,10 +128,11 @@ class JordanISTDCrawler(BaseCrawler):
                             summary=f"Official update from Jordan ISTD: {text}",
                             url=url,
                             categories=categories,
-                            published_at=datetime.utcnow()
+                            published_at=self.crawl_started_at
                         )
 
-                        if not any(a['title'] == text for a in articles):
+                        if text not in seen_titles:
+                            seen_titles.add(text)
                             articles.append(article)
 
                     except Exception:
@@ -132,49 +142,41 @@ class JordanISTDCrawler(BaseCrawler):
             # Process structured items
             for item in items[:20]:
                 try:
-                    if item.select_one('th'):
+                    if css_select_one(item, 'th'):
                         continue
 
-                    title_elem = item.select_one('a, h2, h3, h4, .title, td:first-child')
+                    title_elem = css_select_one(item, TITLE_SELECTOR)
                     if not title_elem:
                         continue
 
-                    title = clean_text(title_elem.get_text())
+                    title = clean_text(title_elem.text())
                     if not title or len(title) < 10:
                         continue
+                    title_lower = title.lower()
 
-                    link = item.select_one('a[href]')
-                    url = page_url
-                    if link:
-                        href = link.get('href', '')
-                        if href and not href.startswith(('javascript:', '#', 'mailto:')):
-                            url = href if href.startswith('http') else f"{self.base_url}{href}"
+                    link = css_select_one(item, LINK_SELECTOR)
+                    url = (self.resolve_href(link.attributes.get('href')) if link else None) or page_url
+                    if self.is_known(url):
+                        continue
 
-                    summary_elem = item.select_one('p, .summary, .description, .excerpt')
-                    summary = title
+                    summary_elem = css_select_one(item, SUMMARY_SELECTOR)
+                    summary, summary_lower = title, title_lower
                     if summary_elem:
-                        summary_text = clean_text(summary_elem.get_text())
+                        summary_text = clean_text(summary_elem.text())
                         if summary_text and len(summary_text) > 20:
-                            summary = summary_text
+                            summary, summary_lower = summary_text, summary_text.lower()
+
+                    if not ITEM_KEYWORDS.matches(title_lower + ' ' + summary_lower):
+                        continue
 
-                    date_elem = item.select_one('time, .date, [class*="date"], td:last-child')
-                    published_at = datetime.utcnow()
+                    date_elem = css_select_one(item, DATE_SELECTOR)
+                    published_at = self.crawl_started_at
                     if date_elem:
-                        date_text = date_elem.get('datetime') or date_elem.get_text()
+                        date_text = date_elem.attributes.get('datetime') or date_elem.text()
                         parsed = parse_date(date_text)
                         if parsed:
                             published_at = parsed
 
-                    keywords = [
-                        'invoice', 'e-invoice', 'einvoice', 'jofotara',
-                        'tax', 'vat', 'electronic', 'compliance',
-                        'mandate', 'registration', 'b2b', 'b2c',
-                    ]
-
-                    content_lower = (title + ' ' + summary).lower()
-                    if not any(kw in content_lower for kw in keywords):
-                        continue
-
                     article_id = generate_article_id(self.source_id, url, published_at)
                     categories = categorize_article(title, summary)
 
@@ -187,7 +189,8 @@ class JordanISTDCrawler(BaseCrawler):
                         published_at=published_at
                     )
 
-                    if not any(a['title'] == title for a in articles):
+                    if title not in seen_titles:
+                        seen_titles.add(title)
                         articles.append(article)
 
                 except Exception:
@@ -5,10 +5,35 @@ One of the oldest English-language newspapers in the UAE
 """
 
 from typing import List, Dict
-from datetime import datetime
 
 from sources.base import BaseCrawler
-from utils import clean_text, parse_date, generate_article_id, categorize_article
+from utils import clean_text, parse_date, generate_article_id, categorize_article, KeywordMatcher, css_select_one
+
+
+# Titles must mention at least one tax-related keyword
+TAX_KEYWORDS = KeywordMatcher([
+    'tax', 'vat', 'invoice', 'e-invoice', 'excise',
+    'corporate tax', 'fta', 'compliance', 'filing',
+    'ministry of finance', 'zatca', 'customs',
+])
+
+# Listing item selectors, tried in order until one matches more than two items
+ITEM_SELECTORS = (
+    'article',
+    '.article-card',
+    '.story-card',
+    '[class*="article"]',
+    '[class*="story"]',
+    '.listing-item',
+    '.post-item',
+    '.card',
+)
+# Headline link first, then the bare headline element
+TITLE_LINK_SELECTOR = 'h2 a, h3 a, .headline a, a.title, a[class*="title"]'
+TITLE_SELECTOR = 'h2, h3, .headline, .title'
+LINK_SELECTOR = 'a[href]'
+SUMMARY_SELECTOR = 'p, .summary, .description, .excerpt, .teaser'
+DATE_SELECTOR = 'time, .date, [class*="date"], [class*="time"]'
 
 
 class KhaleejTimesCrawler(BaseCrawler):
@@ -45,6 +70,7 @@ class KhaleejTimesCrawler(BaseCrawler):
     def crawl(self) -> List[Dict]:
         """Crawl Khaleej Times for tax/invoice news"""
         articles = []
+        seen_titles = set()
 
         urls_to_crawl = [
             f"{self.base_url}/business",
@@ -53,71 +79,48 @@ class KhaleejTimesCrawler(BaseCrawler):
             f"{self.base_url}/business/corporate",
         ]
 
-        for page_url in urls_to_crawl:
-            html_content = self.fetch_page(page_url)
+        for page_url, html_content in self.fetch_pages(urls_to_crawl):
             if not html_content:
                 continue
 
-            soup = self.parse_html(html_content)
-
-            selectors = [
-                'article',
-                '.article-card',
-                '.story-card',
-                '[class*="article"]',
-                '[class*="story"]',
-                '.listing-item',
-                '.post-item',
-                '.card',
-            ]
-
-            items = []
-            for selector in selectors:
-                found = soup.select(selector)
-                if found and len(found) > 2:
-                    items = found
-                    break
+            tree = self.parse_html(html_content)
+
+            items = self.select_items(tree, page_url, ITEM_SELECTORS, min_items=3)
 
             for item in items[:25]:
                 try:
-                    title_elem = item.select_one('h2 a, h3 a, .headline a, a.title, a[class*="title"]')
+                    title_elem = css_select_one(item, TITLE_LINK_SELECTOR)
                     if not title_elem:
-                        title_elem = item.select_one('h2, h3, .headline, .title')
+                        title_elem = css_select_one(item, TITLE_SELECTOR)
                     if not title_elem:
                         continue
 
-                    title = clean_text(title_elem.get_text())
+                    title = clean_text(title_elem.text())
                     if not title or len(title) < 15:
                         continue
 
-                    link = item.select_one('a[href]')
-                    if not link:
-                        continue
-                    href = link.get('href', '')
-                    if not href or href.startswith(('javascript:', '#', 'mailto:')):
+                    # Filter for tax/invoice related content
+                    if not TAX_KEYWORDS.matches(title.lower()):
                         continue
-                    url = href if href.startswith('http') else f"{self.base_url}{href}"
 
-                    # Filter for tax/invoice related content
-                    tax_keywords = [
-                        'tax', 'vat', 'invoice', 'e-invoice', 'excise',
-                        'corporate tax', 'fta', 'compliance', 'filing',
-                        'ministry of finance', 'zatca', 'customs',
-                    ]
-                    if not any(kw in title.lower() for kw in tax_keywords):
+                    link = css_select_one(item, LINK_SELECTOR)
+                    if not link:
+                        continue
+                    url = self.resolve_href(link.attributes.get('href'))
+                    if not url or self.is_known(url):
                         continue
 
-                    summary_elem = item.select_one('p, .summary, .description, .excerpt, .teaser')
+                    summary_elem = css_select_one(item, SUMMARY_SELECTOR)
                     summary = title
                     if summary_elem:
-                        summary_text = clean_text(summary_elem.get_text())
+                        summary_text = clean_text(summary_elem.text())
                         if summary_text and len(summary_text) > 20:
                             summary = summary_text[:300]
 
-                    date_elem = item.select_one('time, .date, [class*="date"], [class*="time"]')
-                    published_at = datetime.utcnow()
+                    date_elem = css_select_one(item, DATE_SELECTOR)
+                    published_at = self.crawl_started_at
                     if date_elem:
-                        date_text = date_elem.get('datetime') or date_elem.get_text()
+                        date_text = date_elem.attributes.get('datetime') or date_elem.text()
                         parsed = parse_date(date_text)
                         if parsed:
                             published_at = parsed
@@ -134,7 +137,8 @@ class KhaleejTimesCrawler(BaseCrawler):
                         published_at=published_at
                     )
 
-                    if not any(a['title'] == title for a in articles):
+                    if title not in seen_titles:
+                        seen_titles.add(title)
                         articles.append(article)
 
                 except Exception:
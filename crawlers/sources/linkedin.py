@@ -9,13 +9,74 @@ import re
 import logging
 import time
 from typing import List, Dict, Optional
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
-from playwright.sync_api import sync_playwright, Page, Browser
-from utils import clean_text, generate_article_id, categorize_article, is_einvoice_related
+from playwright.sync_api import sync_playwright, Page, Browser, TimeoutError as PlaywrightTimeoutError
+from utils import clean_text, generate_article_id, ArticleAnalyzer
 
 logger = logging.getLogger(__name__)
 
+# E-invoice filter and categories in one pass over the post text
+ARTICLE_ANALYZER = ArticleAnalyzer()
+
+# Relative post times such as "2h", "3d", "1w", "2mo"
+RELATIVE_TIME_RE = re.compile(r'(\d+)\s*([hdwmo]+)')
+# Whether a candidate time element's text holds a relative time at all
+RELATIVE_TIME_PROBE_RE = re.compile(r'\d+[hdwmo]')
+
+# Where LinkedIn lands after submitting the login form
+LOGIN_RESULT_RE = re.compile(r'feed|mynetwork|company|checkpoint|challenge')
+SCROLL_ROUNDS = 3
+SCROLL_WAIT_MS = 3000  # give up on a scroll round when the feed stops growing
+
+# Post containers, tried in order until one matches
+POST_SELECTORS = [
+    '[data-urn*="activity"]',
+    '.feed-shared-update-v2',
+    '.occludable-update',
+]
+# Candidate elements for a post's text and its relative time, in order
+TEXT_SELECTORS = [
+    '.feed-shared-text',
+    '.update-components-text',
+    '.break-words',
+    'span[dir="ltr"]'
+]
+TIME_SELECTORS = [
+    '.update-components-actor__sub-description',
+    'time',
+    '.feed-shared-actor__sub-description',
+    'span.visually-hidden'
+]
+MAX_POSTS = 15
+
+# Collects the candidate fields of every post in one round trip to the
+# browser; the selector cascades are resolved in Python as before
+POST_FIELDS_JS = """
+([postSelectors, textSelectors, timeSelectors, limit]) => {
+    let posts = [];
+    for (const selector of postSelectors) {
+        posts = Array.from(document.querySelectorAll(selector));
+        if (posts.length) break;
+    }
+    const innerTexts = (el, selectors) => selectors.map(selector => {
+        const found = el.querySelector(selector);
+        return found ? found.innerText : null;
+    });
+    return {
+        count: posts.length,
+        posts: posts.slice(0, limit).map(el => {
+            const link = el.querySelector('a[href*="activity"]');
+            return {
+                texts: innerTexts(el, textSelectors),
+                times: innerTexts(el, timeSelectors),
+                href: link ? link.getAttribute('href') : null,
+            };
+        }),
+    };
+}
+"""
+
 # Company pages to crawl
 COMPANY_PAGES = [
     {
@@ -70,8 +131,8 @@ class LinkedInCrawler:
             logger.info("Logging in to LinkedIn...")
 
             # Go to login page
-            page.goto('https://www.linkedin.com/login', wait_until='networkidle')
-            time.sleep(2)
+            page.goto('https://www.linkedin.com/login', wait_until='domcontentloaded')
+            page.wait_for_selector('#username')
 
             # Fill credentials
             page.fill('#username', email)
@@ -80,9 +141,11 @@ class LinkedInCrawler:
             # Click login button
             page.click('button[type="submit"]')
 
-            # Wait for navigation
-            page.wait_for_load_state('networkidle')
-            time.sleep(3)
+            # Wait for the redirect away from the login form
+            try:
+                page.wait_for_url(LOGIN_RESULT_RE, timeout=15000)
+            except PlaywrightTimeoutError:
+                pass
 
             # Check if login was successful
             if 'feed' in page.url or 'mynetwork' in page.url or 'company' in page.url:
@@ -103,7 +166,7 @@ class LinkedInCrawler:
 
     def _parse_relative_time(self, time_str: str) -> datetime:
         """Parse LinkedIn's relative time strings like '2h', '3d', '1w'"""
-        now = datetime.utcnow()
+        now = datetime.now(timezone.utc)
 
         if not time_str:
             return now
@@ -111,7 +174,7 @@ class LinkedInCrawler:
         time_str = time_str.lower().strip()
 
         # Match patterns like "2h", "3d", "1w", "2mo"
-        match = re.match(r'(\d+)\s*([hdwmo]+)', time_str)
+        match = RELATIVE_TIME_RE.match(time_str)
         if match:
             value = int(match.group(1))
             unit = match.group(2)
@@ -134,48 +197,34 @@ class LinkedInCrawler:
     def _extract_posts(self, page: Page, company_slug: str, company_name: str) -> List[Dict]:
         """Extract posts from a company page"""
         posts = []
+        seen_titles = set()
+        crawled_at = datetime.now(timezone.utc).isoformat()
 
         try:
             # Wait for posts to load
             page.wait_for_selector('[data-urn*="activity"], .feed-shared-update-v2, .update-components-actor', timeout=10000)
-            time.sleep(2)
 
-            # Scroll to load more posts
-            for _ in range(3):
+            # Scroll to load more posts, waiting only until the feed grows
+            for _ in range(SCROLL_ROUNDS):
+                height = page.evaluate('document.body.scrollHeight')
                 page.evaluate('window.scrollBy(0, 1000)')
-                time.sleep(1)
-
-            # Find all post containers
-            post_selectors = [
-                '[data-urn*="activity"]',
-                '.feed-shared-update-v2',
-                '.occludable-update',
-            ]
-
-            post_elements = []
-            for selector in post_selectors:
-                elements = page.query_selector_all(selector)
-                if elements:
-                    post_elements = elements
+                try:
+                    page.wait_for_function('h => document.body.scrollHeight > h', arg=height, timeout=SCROLL_WAIT_MS)
+                except PlaywrightTimeoutError:
                     break
 
-            logger.info(f"Found {len(post_elements)} posts on {company_name} page")
+            # Read the fields of all post containers at once
+            found = page.evaluate(POST_FIELDS_JS, [POST_SELECTORS, TEXT_SELECTORS, TIME_SELECTORS, MAX_POSTS])
+
+            logger.info(f"Found {found['count']} posts on {company_name} page")
 
-            for i, post_elem in enumerate(post_elements[:15]):  # Limit to 15 posts
+            for i, fields in enumerate(found['posts']):
                 try:
                     # Extract post text
-                    text_selectors = [
-                        '.feed-shared-text',
-                        '.update-components-text',
-                        '.break-words',
-                        'span[dir="ltr"]'
-                    ]
-
                     post_text = ""
-                    for selector in text_selectors:
-                        text_elem = post_elem.query_selector(selector)
-                        if text_elem:
-                            post_text = text_elem.inner_text()
+                    for text in fields['texts']:
+                        if text is not None:
+                            post_text = text
                             if post_text and len(post_text) > 20:
                                 break
 
@@ -185,30 +234,20 @@ class LinkedInCrawler:
                     post_text = clean_text(post_text)
 
                     # Extract time
-                    time_selectors = [
-                        '.update-components-actor__sub-description',
-                        'time',
-                        '.feed-shared-actor__sub-description',
-                        'span.visually-hidden'
-                    ]
-
                     time_str = ""
-                    for selector in time_selectors:
-                        time_elem = post_elem.query_selector(selector)
-                        if time_elem:
-                            time_str = time_elem.inner_text()
-                            if re.search(r'\d+[hdwmo]', time_str.lower()):
+                    for text in fields['times']:
+                        if text is not None:
+                            time_str = text
+                            if RELATIVE_TIME_PROBE_RE.search(time_str.lower()):
                                 break
 
                     published_at = self._parse_relative_time(time_str)
 
                     # Extract post URL
                     post_url = f"https://www.linkedin.com/company/{company_slug}/posts/"
-                    link_elem = post_elem.query_selector('a[href*="activity"]')
-                    if link_elem:
-                        href = link_elem.get_attribute('href')
-                        if href:
-                            post_url = href if href.startswith('http') else f"https://www.linkedin.com{href}"
+                    href = fields['href']
+                    if href:
+                        post_url = href if href.startswith('http') else f"https://www.linkedin.com{href}"
 
                     # Create title from first line or truncate
                     title = post_text.split('\n')[0][:100]
@@ -219,13 +258,15 @@ class LinkedInCrawler:
                     if len(post_text) > 300:
                         summary = summary.rstrip('.') + '...'
 
-                    # Check if e-invoice related
-                    if not is_einvoice_related(title, summary):
+                    # Skip posts matched twice (nested containers) and unrelated posts
+                    if title in seen_titles:
+                        continue
+                    is_einvoice, _, categories = ARTICLE_ANALYZER.analyze(title, summary)
+                    if not is_einvoice:
                         continue
 
-                    # Generate ID and categorize
+                    # Generate ID
                     article_id = generate_article_id('linkedin', post_url, published_at)
-                    categories = categorize_article(title, summary)
 
                     post = {
                         'id': article_id,
@@ -242,9 +283,10 @@ class LinkedInCrawler:
                         'countryName': 'Global',
                         'categories': categories,
                         'publishedAt': published_at.isoformat(),
-                        'crawledAt': datetime.utcnow().isoformat()
+                        'crawledAt': crawled_at
                     }
 
+                    seen_titles.add(title)
                     posts.append(post)
                     logger.info(f"Extracted post: {title[:50]}...")
 
@@ -298,8 +340,7 @@ class LinkedInCrawler:
                     try:
                         logger.info(f"Crawling LinkedIn page: {company['name']}")
 
-                        page.goto(company['url'], wait_until='networkidle')
-                        time.sleep(3)
+                        page.goto(company['url'], wait_until='domcontentloaded')
 
                         posts = self._extract_posts(page, company['slug'], company['name'])
                         articles.extend(posts)
@@ -4,10 +4,9 @@ Crawls country-specific e-invoicing compliance information from pagero.com
 """
 
 from typing import List, Dict
-from datetime import datetime
 
 from sources.base import BaseCrawler
-from utils import clean_text, generate_article_id, categorize_article
+from utils import clean_text, generate_article_id, KeywordMatcher, css_select, css_select_one
 
 
 # Middle East countries to crawl
@@ -35,14 +34,14 @@ EUROPE_COUNTRIES = [
     ('croatia', 'HR', 'Croatia'),
 ]
 
-REGION_MAPPING = {
-    'SA': 'middle-east', 'AE': 'middle-east', 'EG': 'middle-east',
-    'BH': 'middle-east', 'OM': 'middle-east', 'QA': 'middle-east',
-    'JO': 'middle-east', 'KW': 'middle-east',
-    'DE': 'europe', 'FR': 'europe', 'IT': 'europe', 'ES': 'europe',
-    'PL': 'europe', 'BE': 'europe', 'PT': 'europe', 'GR': 'europe',
-    'RO': 'europe', 'HR': 'europe',
-}
+# (slug, code, name, region) for every country page, Middle East first
+COUNTRIES_TO_CRAWL = (
+    [(slug, code, name, 'middle-east') for slug, code, name in MIDDLE_EAST_COUNTRIES]
+    + [(slug, code, name, 'europe') for slug, code, name in EUROPE_COUNTRIES]
+)
+
+# Summaries mentioning any of these get the 'deadline' category
+DEADLINE_KEYWORDS = KeywordMatcher(['deadline', 'effective', 'mandatory', 'january', 'july', '2026', '2027'])
 
 
 class PageroAtlasCrawler(BaseCrawler):
@@ -68,18 +67,18 @@ class PageroAtlasCrawler(BaseCrawler):
         """Crawl Pagero country compliance pages"""
         articles = []
 
-        # Prioritize Middle East countries
-        countries_to_crawl = MIDDLE_EAST_COUNTRIES + EUROPE_COUNTRIES
+        page_urls = [
+            f"{self.base_url}/compliance/regulatory-updates/{slug}"
+            for slug, _, _, _ in COUNTRIES_TO_CRAWL
+        ]
+        pages = self.fetch_pages(page_urls)
 
-        for slug, country_code, country_name in countries_to_crawl:
+        for (_, country_code, country_name, region), (page_url, html_content) in zip(COUNTRIES_TO_CRAWL, pages):
             try:
-                page_url = f"{self.base_url}/compliance/regulatory-updates/{slug}"
-                html_content = self.fetch_page(page_url)
-
                 if not html_content:
                     continue
 
-                soup = self.parse_html(html_content)
+                tree = self.parse_html(html_content)
 
                 # Extract main content
                 content_selectors = [
@@ -92,29 +91,31 @@ class PageroAtlasCrawler(BaseCrawler):
 
                 main_content = None
                 for selector in content_selectors:
-                    main_content = soup.select_one(selector)
+                    main_content = css_select_one(tree, selector)
                     if main_content:
                         break
 
                 if not main_content:
-                    main_content = soup
+                    main_content = tree
 
                 # Extract page title
-                title_elem = main_content.select_one('h1, .page-title, .title')
+                title_elem = css_select_one(main_content, 'h1, .page-title, .title')
                 title = f"{country_name} E-Invoicing Compliance Update"
                 if title_elem:
-                    title_text = clean_text(title_elem.get_text())
+                    title_text = clean_text(title_elem.text())
                     if title_text:
                         title = title_text
 
                 # Extract summary from first paragraphs
-                paragraphs = main_content.select('p')
+                paragraphs = css_select(main_content, 'p')
                 summary_parts = []
+                summary_len = -1  # length of the parts joined with spaces
                 for p in paragraphs[:3]:
-                    text = clean_text(p.get_text())
+                    text = clean_text(p.text())
                     if text and len(text) > 30:
                         summary_parts.append(text)
-                        if len(' '.join(summary_parts)) > 200:
+                        summary_len += len(text) + 1
+                        if summary_len > 200:
                             break
 
                 summary = ' '.join(summary_parts)[:300]
@@ -122,12 +123,10 @@ class PageroAtlasCrawler(BaseCrawler):
                     summary = f"E-invoicing regulatory updates and compliance requirements for {country_name}"
 
                 # Extract key dates/deadlines if present
-                deadline_keywords = ['deadline', 'effective', 'mandatory', 'january', 'july', '2026', '2027']
-                has_deadline = any(kw in summary.lower() for kw in deadline_keywords)
+                has_deadline = DEADLINE_KEYWORDS.matches(summary.lower())
 
                 # Generate article
-                region = REGION_MAPPING.get(country_code, 'global')
-                article_id = generate_article_id(self.source_id, page_url, datetime.utcnow())
+                article_id = generate_article_id(self.source_id, page_url, self.crawl_started_at)
 
                 categories = ['compliance', 'regulation']
                 if has_deadline:
@@ -139,7 +138,7 @@ class PageroAtlasCrawler(BaseCrawler):
                     summary=summary if summary else title,
                     url=page_url,
                     categories=categories,
-                    published_at=datetime.utcnow(),
+                    published_at=self.crawl_started_at,
                     region=region,
                     country=country_code,
                     country_name=country_name
@@ -0,0 +1,86 @@
+"""
+Pool of HTTP sessions shared by all crawlers
+Each session has its own User-Agent and cookie jar; sessions that get blocked
+are retired and replaced so later requests start from a clean identity
+"""
+
+import itertools
+import logging
+import threading
+from typing import Callable, List
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+# Desktop browser User-Agents handed out to new sessions in turn
+USER_AGENTS = [
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 Safari/605.1.15',
+    'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36 Edg/120.0.0.0',
+]
+
+
+class SessionPool:
+    """Round-robin pool of sessions with usage limits and retirement"""
+
+    def __init__(self, session_factory: Callable[[str], requests.Session],
+                 max_size: int = 10, max_usage: int = 150):
+        """
+        Args:
+            session_factory: Creates a configured session for a User-Agent
+            max_size: Maximum number of live sessions
+            max_usage: Requests a session serves before it is replaced
+        """
+        self.session_factory = session_factory
+        self.max_size = max_size
+        self.max_usage = max_usage
+        self._sessions: List[requests.Session] = []
+        self._usage = {}
+        self._next = 0
+        self._user_agents = itertools.cycle(USER_AGENTS)
+        self._lock = threading.Lock()
+
+    def _create(self) -> requests.Session:
+        session = self.session_factory(next(self._user_agents))
+        self._sessions.append(session)
+        self._usage[id(session)] = 0
+        return session
+
+    def get(self) -> requests.Session:
+        """Return the next session to use for a request"""
+        with self._lock:
+            if len(self._sessions) < self.max_size:
+                session = self._create()
+            else:
+                self._next %= len(self._sessions)
+                session = self._sessions[self._next]
+                self._next += 1
+
+            self._usage[id(session)] += 1
+            if self._usage[id(session)] >= self.max_usage:
+                # Last request for this session; the pool refills on demand
+                self._remove(session)
+            return session
+
+    def retire(self, session: requests.Session) -> None:
+        """Drop a session that was blocked (e.g. 403/429)"""
+        with self._lock:
+            if id(session) in self._usage:
+                logger.info(f"Retiring blocked session ({session.headers.get('User-Agent', '')[:40]}...)")
+                self._remove(session)
+
+    def _remove(self, session: requests.Session) -> None:
+        self._sessions.remove(session)
+        del self._usage[id(session)]
+
+    def close(self) -> None:
+        """Close all live sessions"""
+        with self._lock:
+            for session in self._sessions:
+                session.close()
+            self._sessions.clear()
+            self._usage.clear()
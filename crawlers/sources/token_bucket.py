@@ -0,0 +1,39 @@
+"""
+Token bucket rate limiter shared by crawler threads
+Tokens refill continuously, so a burst that exhausts the bucket waits only
+for the next token instead of for the whole rate period to reset
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """Thread-safe token bucket; each acquire() takes one token"""
+
+    def __init__(self, rate: float, capacity: int):
+        """
+        Args:
+            rate: Tokens added per second
+            capacity: Most tokens the bucket holds, i.e. the largest burst
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take a token, sleeping until one is available"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Reserve the token even if it has not refilled yet; callers
+            # queue behind each other by the debt they leave
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        # Sleep outside the lock so other threads can reserve their turn
+        if wait > 0:
+            time.sleep(wait)
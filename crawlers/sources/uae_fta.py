@@ -4,10 +4,31 @@ Crawls official announcements from tax.gov.ae
 """
 
 from typing import List, Dict
-from datetime import datetime
 
 from sources.base import BaseCrawler
-from utils import clean_text, parse_date, generate_article_id, categorize_article
+from utils import clean_text, parse_date, generate_article_id, categorize_article, KeywordMatcher, css_select_one
+
+
+# Titles must mention at least one tax-related keyword
+TAX_KEYWORDS = KeywordMatcher([
+    'vat', 'tax', 'invoice', 'e-invoice', 'einvoice',
+    'excise', 'corporate', 'return', 'refund', 'compliance',
+    'registration', 'deadline', 'penalty', 'fta',
+])
+
+# Listing item selectors, tried in order until one matches more than one item
+ITEM_SELECTORS = (
+    'table tr',
+    '.announcement-item',
+    '.news-item',
+    'article',
+    '.list-item',
+    '[class*="announcement"]',
+    '[class*="news"]',
+)
+TITLE_SELECTOR = 'a, td:first-child, .title, h3, h4'
+LINK_SELECTOR = 'a[href]'
+DATE_SELECTOR = 'time, .date, td:last-child, [class*="date"]'
 
 
 class UAEFTACrawler(BaseCrawler):
@@ -44,81 +65,52 @@ class UAEFTACrawler(BaseCrawler):
     def crawl(self) -> List[Dict]:
         """Crawl UAE FTA announcements page"""
         articles = []
+        seen_titles = set()
 
         urls_to_crawl = [
             f"{self.base_url}/en/announcements.aspx",
             f"{self.base_url}/en/news.aspx",
         ]
 
-        for page_url in urls_to_crawl:
-            html_content = self.fetch_page(page_url)
+        for page_url, html_content in self.fetch_pages(urls_to_crawl):
             if not html_content:
                 continue
 
-            soup = self.parse_html(html_content)
+            tree = self.parse_html(html_content)
 
             # FTA uses table-based or list-based announcements
-            selectors = [
-                'table tr',
-                '.announcement-item',
-                '.news-item',
-                'article',
-                '.list-item',
-                '[class*="announcement"]',
-                '[class*="news"]',
-            ]
-
-            items = []
-            for selector in selectors:
-                found = soup.select(selector)
-                if found and len(found) > 1:
-                    items = found
-                    break
+            items = self.select_items(tree, page_url, ITEM_SELECTORS, min_items=2)
 
             for item in items[:20]:
                 try:
                     # Skip header rows
-                    if item.select_one('th'):
+                    if css_select_one(item, 'th'):
                         continue
 
                     # Extract title from link or text
-                    title_elem = item.select_one('a, td:first-child, .title, h3, h4')
+                    title_elem = css_select_one(item, TITLE_SELECTOR)
                     if not title_elem:
                         continue
 
-                    title = clean_text(title_elem.get_text())
+                    title = clean_text(title_elem.text())
                     if not title or len(title) < 10:
                         continue
 
                     # Extract URL
-                    link = item.select_one('a[href]')
-                    url = ""
-                    if link:
-                        href = link.get('href', '')
-                        # Skip javascript: links and other invalid hrefs
-                        if href and not href.startswith(('javascript:', '#', 'mailto:')):
-                            url = href if href.startswith('http') else f"{self.base_url}{href}"
-
-                    if not url:
-                        url = page_url
+                    link = css_select_one(item, LINK_SELECTOR)
+                    url = (self.resolve_href(link.attributes.get('href')) if link else None) or page_url
 
                     # Extract date
-                    date_elem = item.select_one('time, .date, td:last-child, [class*="date"]')
-                    published_at = datetime.utcnow()
+                    date_elem = css_select_one(item, DATE_SELECTOR)
+                    published_at = self.crawl_started_at
                     if date_elem:
-                        date_text = date_elem.get('datetime') or date_elem.get_text()
+                        date_text = date_elem.attributes.get('datetime') or date_elem.text()
                         parsed = parse_date(date_text)
                         if parsed:
                             published_at = parsed
 
                     # Filter for tax/invoice related content
-                    tax_keywords = [
-                        'vat', 'tax', 'invoice', 'e-invoice', 'einvoice',
-                        'excise', 'corporate', 'return', 'refund', 'compliance',
-                        'registration', 'deadline', 'penalty', 'fta',
-                    ]
-
-                    if not any(kw in title.lower() for kw in tax_keywords):
+                    if not TAX_KEYWORDS.matches(title.lower()):
                         continue
 
                     # Generate article
@@ -134,7 +126,8 @@ class UAEFTACrawler(BaseCrawler):
                         published_at=published_at
                     )
 
-                    if not any(a['title'] == title for a in articles):
+                    if title not in seen_titles:
+                        seen_titles.add(title)
                         articles.append(article)
 
                 except Exception:
@@ -8,24 +8,25 @@ from datetime import datetime, timedelta
 import re
 
 from sources.base import BaseCrawler
-from utils import clean_text, parse_date, generate_article_id, categorize_article
+from utils import clean_text, parse_date, generate_article_id, ArticleAnalyzer, css_select_one
 
-# Country detection keywords for VATupdate articles
+# Country detection keywords for VATupdate articles; short acronyms are
+# padded with spaces so they only match as whole words
 COUNTRY_KEYWORDS = {
     # Middle East
     'SA': ['saudi', 'zatca', 'ksa', 'fatoorah'],
-    'AE': ['uae', 'emirates', 'dubai', 'fta '],
-    'EG': ['egypt', 'egyptian', 'eta '],
+    'AE': ['uae', 'emirates', 'dubai', ' fta '],
+    'EG': ['egypt', 'egyptian', ' eta '],
     'BH': ['bahrain'],
     'OM': ['oman'],
     'QA': ['qatar'],
     'KW': ['kuwait'],
     'JO': ['jordan'],
     # Europe
-    'EU': ['european union', 'eu ', 'vida', 'european commission'],
+    'EU': ['european union', ' eu ', 'vida', 'european commission'],
     'DE': ['germany', 'german', 'xrechnung', 'zugferd'],
     'FR': ['france', 'french', 'chorus pro', 'factur-x'],
-    'IT': ['italy', 'italian', 'sdi '],
+    'IT': ['italy', 'italian', ' sdi '],
     'ES': ['spain', 'spanish', 'verifactu', 'ticketbai'],
     'PL': ['poland', 'polish', 'ksef'],
     'BE': ['belgium', 'belgian'],
@@ -81,6 +82,23 @@ COUNTRY_NAMES = {
     'KE': 'Kenya', 'NG': 'Nigeria', 'ZA': 'South Africa',
 }
 
+# (code, name, region) for each country, built once; NO_COUNTRY when none matches
+COUNTRY_INFO = {
+    code: (code, COUNTRY_NAMES.get(code), REGION_MAPPING.get(code, 'global'))
+    for code in COUNTRY_KEYWORDS
+}
+NO_COUNTRY = (None, 'Global', 'global')
+
+# Title or summary must mention e-invoicing or digital reporting
+EINVOICE_KEYWORDS = [
+    'e-invoice', 'einvoice', 'e-invoicing', 'electronic invoice',
+    'digital reporting', 'e-reporting', 'ctc', 'real-time reporting',
+    'vat reporting', 'tax digitalization', 'vida',
+]
+
+# E-invoice filter, country detection and categories in one pass over the text
+ARTICLE_ANALYZER = ArticleAnalyzer(COUNTRY_KEYWORDS, einvoice_keywords=EINVOICE_KEYWORDS)
+
 
 class VATUpdateCrawler(BaseCrawler):
     """Crawler for VATupdate - Daily VAT/e-invoicing news aggregator"""
@@ -101,24 +119,9 @@ class VATUpdateCrawler(BaseCrawler):
     def base_url(self) -> str:
         return "https://www.vatupdate.com"
 
-    def detect_country(self, title: str, summary: str) -> tuple:
-        """Detect country from article content"""
-        text = (title + ' ' + summary).lower()
-
-        for country_code, keywords in COUNTRY_KEYWORDS.items():
-            for keyword in keywords:
-                if keyword in text:
-                    return (
-                        country_code,
-                        COUNTRY_NAMES.get(country_code),
-                        REGION_MAPPING.get(country_code, 'global')
-                    )
-
-        return (None, 'Global', 'global')
-
     def parse_relative_time(self, time_str: str) -> datetime:
         """Parse relative time strings like '2 hours ago', '1 day ago'"""
-        now = datetime.utcnow()
+        now = self.crawl_started_at
         time_str = time_str.lower().strip()
 
         patterns = [
@@ -149,18 +152,18 @@ class VATUpdateCrawler(BaseCrawler):
     def crawl(self) -> List[Dict]:
         """Crawl VATupdate homepage and e-invoicing category"""
         articles = []
+        seen_urls = set()
 
         urls_to_crawl = [
             self.base_url,
             f"{self.base_url}/category/e-invoicing-e-reporting/",
         ]
 
-        for page_url in urls_to_crawl:
-            html_content = self.fetch_page(page_url)
+        for page_url, html_content in self.fetch_pages(urls_to_crawl):
             if not html_content:
                 continue
 
-            soup = self.parse_html(html_content)
+            tree = self.parse_html(html_content)
 
             # VATupdate uses WordPress with article cards
             article_selectors = [
@@ -171,43 +174,34 @@ class VATUpdateCrawler(BaseCrawler):
                 '[class*="post-"]',
             ]
 
-            post_elements = []
-            for selector in article_selectors:
-                elements = soup.select(selector)
-                if elements:
-                    post_elements = elements
-                    break
+            post_elements = self.select_items(tree, page_url, article_selectors)
 
             for post in post_elements[:30]:
                 try:
                     # Extract title
-                    title_elem = post.select_one('h2 a, h3 a, .entry-title a, .post-title a')
+                    title_elem = css_select_one(post, 'h2 a, h3 a, .entry-title a, .post-title a')
                     if not title_elem:
-                        title_elem = post.select_one('h2, h3, .title')
+                        title_elem = css_select_one(post, 'h2, h3, .title')
 
                     if not title_elem:
                         continue
 
-                    title = clean_text(title_elem.get_text())
+                    title = clean_text(title_elem.text())
                     if not title or len(title) < 15:
                         continue
 
                     # Extract URL
-                    link = title_elem if title_elem.name == 'a' else post.select_one('a[href]')
-                    url = ""
-                    if link and link.get('href'):
-                        url = link.get('href')
-                        if not url.startswith('http'):
-                            url = f"{self.base_url}{url}"
+                    link = title_elem if title_elem.tag == 'a' else css_select_one(post, 'a[href]')
+                    url = self.resolve_href(link.attributes.get('href')) if link else None
 
                     if not url or 'vatupdate.com' not in url:
                         continue
 
                     # Extract date
-                    date_elem = post.select_one('time, .date, .post-date, .entry-date, [class*="time"]')
-                    published_at = datetime.utcnow()
+                    date_elem = css_select_one(post, 'time, .date, .post-date, .entry-date, [class*="time"]')
+                    published_at = self.crawl_started_at
                     if date_elem:
-                        date_str = date_elem.get('datetime') or date_elem.get_text()
+                        date_str = date_elem.attributes.get('datetime') or date_elem.text()
                         if 'ago' in date_str.lower():
                             published_at = self.parse_relative_time(date_str)
                         else:
@@ -216,30 +210,22 @@ class VATUpdateCrawler(BaseCrawler):
                                 published_at = parsed
 
                     # Extract summary/excerpt
-                    summary_elem = post.select_one('.excerpt, .entry-summary, .post-excerpt, p')
+                    summary_elem = css_select_one(post, '.excerpt, .entry-summary, .post-excerpt, p')
                     summary = title
                     if summary_elem:
-                        summary_text = clean_text(summary_elem.get_text())
+                        summary_text = clean_text(summary_elem.text())
                         if len(summary_text) > 30:
                             summary = summary_text[:300] + '...' if len(summary_text) > 300 else summary_text
 
-                    # Filter for e-invoicing related content
-                    einvoice_keywords = [
-                        'e-invoice', 'einvoice', 'e-invoicing', 'electronic invoice',
-                        'digital reporting', 'e-reporting', 'ctc', 'real-time reporting',
-                        'vat reporting', 'tax digitalization', 'vida',
-                    ]
-
-                    text_lower = (title + ' ' + summary).lower()
-                    if not any(kw in text_lower for kw in einvoice_keywords):
+                    # Filter for e-invoicing related content, detect country and categorize
+                    is_einvoice, country_code, categories = ARTICLE_ANALYZER.analyze(title, summary)
+                    if not is_einvoice:
                         continue
 
-                    # Detect country
-                    country_code, country_name, region = self.detect_country(title, summary)
+                    country_code, country_name, region = COUNTRY_INFO.get(country_code, NO_COUNTRY)
 
-                    # Generate ID and categorize
+                    # Generate ID
                     article_id = generate_article_id(self.source_id, url, published_at)
-                    categories = categorize_article(title, summary)
 
                     article = self.create_article(
                         article_id=article_id,
@@ -254,7 +240,8 @@ class VATUpdateCrawler(BaseCrawler):
                     )
 
                     # Avoid duplicates
-                    if not any(a['url'] == url for a in articles):
+                    if url not in seen_urls:
+                        seen_urls.add(url)
                         articles.append(article)
 
                 except Exception as e:
@@ -4,11 +4,10 @@ Crawls e-invoicing news from Vertex website
 """
 
 from typing import List, Dict
-from datetime import datetime
 
 from sources.base import BaseCrawler
-from utils import clean_text, parse_date, generate_article_id, categorize_article, is_einvoice_related
-from sources.ey import COUNTRY_KEYWORDS, REGION_MAPPING, COUNTRY_NAMES
+from utils import clean_text, parse_date, generate_article_id, css_select, css_select_one
+from sources.ey import ARTICLE_ANALYZER, COUNTRY_INFO, NO_COUNTRY
 
 
 class VertexCrawler(BaseCrawler):
@@ -30,14 +29,6 @@ class VertexCrawler(BaseCrawler):
     def base_url(self) -> str:
         return "https://www.vertexinc.com"
 
-    def detect_country(self, title: str, summary: str) -> tuple:
-        text = (title + ' ' + summary).lower()
-        for country_code, keywords in COUNTRY_KEYWORDS.items():
-            for keyword in keywords:
-                if keyword in text:
-                    return (country_code, COUNTRY_NAMES.get(country_code), REGION_MAPPING.get(country_code, 'global'))
-        return (None, 'Global', 'global')
-
     def crawl(self) -> List[Dict]:
         articles = []
         news_url = f"{self.base_url}/resources"
@@ -46,38 +37,36 @@ class VertexCrawler(BaseCrawler):
         if not html_content:
             return articles
 
-        soup = self.parse_html(html_content)
-        news_items = soup.select('.resource-item, .post, article, .card, [class*="resource"]')
+        tree = self.parse_html(html_content)
+        news_items = css_select(tree, '.resource-item, .post, article, .card, [class*="resource"]')
 
         for item in news_items[:25]:
             try:
-                title_elem = item.select_one('h2, h3, h4, .title, a')
+                title_elem = css_select_one(item, 'h2, h3, h4, .title, a')
                 if not title_elem:
                     continue
 
-                title = clean_text(title_elem.get_text())
+                title = clean_text(title_elem.text())
                 if not title or len(title) < 10:
                     continue
 
-                link = item.select_one('a[href]')
-                url = link.get('href', '') if link else ''
-                if url and not url.startswith('http'):
-                    url = f"{self.base_url}{url}"
+                link = css_select_one(item, 'a[href]')
+                url = self.resolve_href(link.attributes.get('href')) if link else None
                 if not url:
                     continue
 
-                date_elem = item.select_one('.date, time, [class*="date"]')
-                published_at = parse_date(date_elem.get('datetime') or date_elem.get_text()) if date_elem else datetime.utcnow()
+                date_elem = css_select_one(item, '.date, time, [class*="date"]')
+                published_at = parse_date(date_elem.attributes.get('datetime') or date_elem.text()) if date_elem else self.crawl_started_at
 
-                summary_elem = item.select_one('.summary, .excerpt, p')
-                summary = clean_text(summary_elem.get_text())[:300] if summary_elem else title
+                summary_elem = css_select_one(item, '.summary, .excerpt, p')
+                summary = clean_text(summary_elem.text())[:300] if summary_elem else title
 
-                if not is_einvoice_related(title, summary):
+                is_einvoice, country_code, categories = ARTICLE_ANALYZER.analyze(title, summary)
+                if not is_einvoice:
                     continue
 
-                country_code, country_name, region = self.detect_country(title, summary)
+                country_code, country_name, region = COUNTRY_INFO.get(country_code, NO_COUNTRY)
                 article_id = generate_article_id(self.source_id, url, published_at)
-                categories = categorize_article(title, summary)
 
                 articles.append(self.create_article(
                     article_id=article_id, title=title, summary=summary, url=url,
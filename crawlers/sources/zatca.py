@@ -4,10 +4,16 @@ Crawls news from the Zakat, Tax and Customs Authority website
 """
 
 from typing import List, Dict
-from datetime import datetime
 
 from sources.base import BaseCrawler
-from utils import clean_text, parse_date, generate_article_id, categorize_article, is_einvoice_related
+from utils import clean_text, parse_date, generate_article_id, ArticleAnalyzer, KeywordMatcher, css_select, css_select_one
+
+
+# ZATCA news outside e-invoicing is kept when it mentions any of these
+TAX_KEYWORDS = KeywordMatcher(['tax', 'vat', 'zakat', 'customs', 'invoice', 'e-invoice', 'fatoorah'])
+
+# E-invoice check and categories in one pass over the text
+ARTICLE_ANALYZER = ArticleAnalyzer()
 
 
 class ZATCACrawler(BaseCrawler):
@@ -52,64 +58,60 @@ class ZATCACrawler(BaseCrawler):
         if not html_content:
             return articles
 
-        soup = self.parse_html(html_content)
+        tree = self.parse_html(html_content)
 
         # Find news items - ZATCA uses SharePoint-style lists
-        news_items = soup.select('.news-item, .ms-rtestate-field, .news-list-item, [class*="news"]')
+        news_items = css_select(tree, '.news-item, .ms-rtestate-field, .news-list-item, [class*="news"]')
 
         # Also try common news selectors
         if not news_items:
-            news_items = soup.select('article, .item, .post, li[class*="news"]')
+            news_items = css_select(tree, 'article, .item, .post, li[class*="news"]')
 
         for item in news_items[:20]:  # Limit to 20 most recent
             try:
                 # Extract title
-                title_elem = item.select_one('h2, h3, h4, .title, a[class*="title"]')
+                title_elem = css_select_one(item, 'h2, h3, h4, .title, a[class*="title"]')
                 if not title_elem:
                     continue
 
-                title = clean_text(title_elem.get_text())
+                title = clean_text(title_elem.text())
                 if not title or len(title) < 10:
                     continue
 
                 # Extract URL
-                link = item.select_one('a[href]')
-                if link:
-                    url = link.get('href', '')
-                    if url and not url.startswith('http'):
-                        url = f"{self.base_url}{url}"
-                else:
+                link = css_select_one(item, 'a[href]')
+                url = self.resolve_href(link.attributes.get('href')) if link else None
+                if not url:
                     continue
 
                 # Extract date
-                date_elem = item.select_one('.date, time, [class*="date"], span[class*="time"]')
+                date_elem = css_select_one(item, '.date, time, [class*="date"], span[class*="time"]')
                 published_at = None
                 if date_elem:
-                    date_text = date_elem.get('datetime') or date_elem.get_text()
+                    date_text = date_elem.attributes.get('datetime') or date_elem.text()
                     published_at = parse_date(date_text)
 
                 if not published_at:
-                    published_at = datetime.utcnow()
+                    published_at = self.crawl_started_at
 
                 # Extract summary
-                summary_elem = item.select_one('.summary, .description, .excerpt, p')
+                summary_elem = css_select_one(item, '.summary, .description, .excerpt, p')
                 summary = ""
                 if summary_elem:
-                    summary = clean_text(summary_elem.get_text())[:300]
+                    summary = clean_text(summary_elem.text())[:300]
 
                 if not summary:
                     summary = title
 
-                # Check if e-invoice related
-                if not is_einvoice_related(title, summary):
+                # Check if e-invoice related and categorize
+                is_einvoice, _, categories = ARTICLE_ANALYZER.analyze(title, summary)
+                if not is_einvoice:
                     # For ZATCA, include all tax-related news
-                    keywords = ['tax', 'vat', 'zakat', 'customs', 'invoice', 'e-invoice', 'fatoorah']
-                    if not any(kw in (title + summary).lower() for kw in keywords):
+                    if not TAX_KEYWORDS.matches((title + summary).lower()):
                         continue
 
-                # Generate ID and categorize
+                # Generate ID
                 article_id = generate_article_id(self.source_id, url, published_at)
-                categories = categorize_article(title, summary)
 
                 article = self.create_article(
                     article_id=article_id,
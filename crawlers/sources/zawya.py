@@ -5,10 +5,13 @@ Part of Refinitiv/Reuters - major MENA financial news source
 """
 
 from typing import List, Dict
-from datetime import datetime
 
 from sources.base import BaseCrawler
-from utils import clean_text, parse_date, generate_article_id, categorize_article
+from utils import clean_text, parse_date, generate_article_id, categorize_article, KeywordMatcher, css_select, css_select_one
+
+
+# Titles must mention at least one tax-related keyword
+TAX_KEYWORDS = KeywordMatcher(['tax', 'vat', 'invoice', 'excise', 'compliance', 'fta', 'zatca', 'zakat', 'customs'])
 
 
 class ZawyaCrawler(BaseCrawler):
@@ -45,6 +48,7 @@ class ZawyaCrawler(BaseCrawler):
     def crawl(self) -> List[Dict]:
         """Crawl Zawya for tax/invoice news"""
         articles = []
+        seen_titles = set()
 
         urls_to_crawl = [
             f"{self.base_url}/mena/en/economy",
@@ -54,12 +58,11 @@ class ZawyaCrawler(BaseCrawler):
             f"{self.base_url}/mena/en/legal",
         ]
 
-        for page_url in urls_to_crawl:
-            html_content = self.fetch_page(page_url)
+        for page_url, html_content in self.fetch_pages(urls_to_crawl):
             if not html_content:
                 continue
 
-            soup = self.parse_html(html_content)
+            tree = self.parse_html(html_content)
 
             selectors = [
                 'article',
@@ -71,55 +74,49 @@ class ZawyaCrawler(BaseCrawler):
                 '.card',
             ]
 
-            items = []
-            for selector in selectors:
-                found = soup.select(selector)
-                if found and len(found) > 2:
-                    items = found
-                    break
+            items = self.select_items(tree, page_url, selectors, min_items=3)
 
             # Also try finding links directly
             if not items:
-                items = soup.select('a[href*="/story/"]')
+                items = css_select(tree, 'a[href*="/story/"]')
 
             for item in items[:25]:
                 try:
-                    if item.name == 'a':
-                        title = clean_text(item.get_text())
-                        href = item.get('href', '')
+                    if item.tag == 'a':
+                        title = clean_text(item.text())
+                        href = item.attributes.get('href') or ''
                     else:
-                        title_elem = item.select_one('h2 a, h3 a, .headline a, a.title')
+                        title_elem = css_select_one(item, 'h2 a, h3 a, .headline a, a.title')
                         if not title_elem:
-                            title_elem = item.select_one('h2, h3, .headline')
+                            title_elem = css_select_one(item, 'h2, h3, .headline')
                         if not title_elem:
                             continue
-                        title = clean_text(title_elem.get_text())
-                        link = item.select_one('a[href]')
-                        href = link.get('href', '') if link else ''
+                        title = clean_text(title_elem.text())
+                        link = css_select_one(item, 'a[href]')
+                        href = (link.attributes.get('href') or '') if link else ''
 
                     if not title or len(title) < 15:
                         continue
 
-                    if not href or href.startswith(('javascript:', '#', 'mailto:')):
+                    url = self.resolve_href(href)
+                    if not url:
                         continue
-                    url = href if href.startswith('http') else f"{self.base_url}{href}"
 
                     # Filter for tax/invoice related content
-                    tax_keywords = ['tax', 'vat', 'invoice', 'excise', 'compliance', 'fta', 'zatca', 'zakat', 'customs']
-                    if not any(kw in title.lower() for kw in tax_keywords):
+                    if not TAX_KEYWORDS.matches(title.lower()):
                         continue
 
-                    summary_elem = item.select_one('p, .summary, .description, .excerpt') if item.name != 'a' else None
+                    summary_elem = css_select_one(item, 'p, .summary, .description, .excerpt') if item.tag != 'a' else None
                     summary = title
                     if summary_elem:
-                        summary_text = clean_text(summary_elem.get_text())
+                        summary_text = clean_text(summary_elem.text())
                         if summary_text and len(summary_text) > 20:
                             summary = summary_text[:300]
 
-                    date_elem = item.select_one('time, .date, [class*="date"]') if item.name != 'a' else None
-                    published_at = datetime.utcnow()
+                    date_elem = css_select_one(item, 'time, .date, [class*="date"]') if item.tag != 'a' else None
+                    published_at = self.crawl_started_at
                     if date_elem:
-                        date_text = date_elem.get('datetime') or date_elem.get_text()
+                        date_text = date_elem.attributes.get('datetime') or date_elem.text()
                         parsed = parse_date(date_text)
                         if parsed:
                             published_at = parsed
@@ -136,7 +133,8 @@ class ZawyaCrawler(BaseCrawler):
                         published_at=published_at
                     )
 
-                    if not any(a['title'] == title for a in articles):
+                    if title not in seen_titles:
+                        seen_titles.add(title)
                         articles.append(article)
 
                 except Exception:
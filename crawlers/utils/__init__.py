@@ -6,11 +6,14 @@ from .parser import (
     clean_text,
     extract_text_from_html,
     parse_date,
+    css_select,
+    css_select_one,
     extract_summary,
     extract_date,
     generate_article_id,
     categorize_article,
-    is_einvoice_related
+    is_einvoice_related,
+    ArticleAnalyzer
 )
 
 from .deduplicator import (
@@ -20,17 +23,24 @@ from .deduplicator import (
     merge_with_existing
 )
 
+from .keywords import KeywordMatcher, KeywordTagger
+
 __all__ = [
     'clean_text',
     'extract_text_from_html',
     'parse_date',
+    'css_select',
+    'css_select_one',
     'extract_summary',
     'extract_date',
     'generate_article_id',
     'categorize_article',
     'is_einvoice_related',
+    'ArticleAnalyzer',
     'compute_content_hash',
     'compute_title_similarity',
     'deduplicate_articles',
-    'merge_with_existing'
+    'merge_with_existing',
+    'KeywordMatcher',
+    'KeywordTagger'
 ]
@@ -3,6 +3,7 @@ Deduplication utilities for the eInvoice News Crawler
 """
 
 import hashlib
+import heapq
 from typing import List, Dict
 from difflib import SequenceMatcher
 
@@ -10,7 +11,8 @@ from difflib import SequenceMatcher
 def compute_content_hash(title: str, url: str) -> str:
     """Compute a hash for detecting duplicate content"""
     content = f"{title.lower().strip()}|{url.lower().strip()}"
-    return hashlib.md5(content.encode()).hexdigest()
+    # Only compared within one run, so any fast hash will do
+    return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
 
 
 def compute_title_similarity(title1: str, title2: str) -> float:
@@ -35,6 +37,10 @@ def deduplicate_articles(articles: List[Dict], similarity_threshold: float = 0.8
     seen_urls = set()
     seen_hashes = set()
     unique_articles = []
+    # One matcher per unique article with its lowercased title as seq2;
+    # SequenceMatcher caches its analysis of seq2, so each comparison only
+    # swaps in the candidate title as seq1
+    unique_matchers = []
 
     for article in articles:
         url = article.get('url', '').lower().strip()
@@ -52,10 +58,15 @@ def deduplicate_articles(articles: List[Dict], similarity_threshold: float = 0.8
             continue
 
         # Check title similarity with existing articles
+        title_lower = title.lower()
         is_duplicate = False
-        for existing in unique_articles:
-            existing_title = existing.get('title', '').strip()
-            if compute_title_similarity(title, existing_title) >= similarity_threshold:
+        for matcher in unique_matchers:
+            matcher.set_seq1(title_lower)
+            # real_quick_ratio() and quick_ratio() are cheap upper bounds on
+            # ratio(), so most pairs are ruled out before the full match
+            if (matcher.real_quick_ratio() >= similarity_threshold
+                    and matcher.quick_ratio() >= similarity_threshold
+                    and matcher.ratio() >= similarity_threshold):
                 is_duplicate = True
                 break
 
@@ -63,6 +74,9 @@ def deduplicate_articles(articles: List[Dict], similarity_threshold: float = 0.8
             seen_urls.add(url)
             seen_hashes.add(content_hash)
             unique_articles.append(article)
+            matcher = SequenceMatcher(None)
+            matcher.set_seq2(title_lower)
+            unique_matchers.append(matcher)
 
     return unique_articles
 
@@ -85,11 +99,10 @@ def merge_with_existing(new_articles: List[Dict], existing_articles: List[Dict],
     # Deduplicate
     unique_articles = deduplicate_articles(all_articles)
 
-    # Sort by published date (newest first)
-    unique_articles.sort(
-        key=lambda x: x.get('publishedAt', ''),
-        reverse=True
+    # Newest max_articles by published date; same result and tie order as a
+    # full reverse sort followed by a slice
+    return heapq.nlargest(
+        max_articles,
+        unique_articles,
+        key=lambda x: x.get('publishedAt', '')
     )
-
-    # Limit to max articles
-    return unique_articles[:max_articles]
@@ -0,0 +1,68 @@
+"""
+Keyword matching utilities for the eInvoice News Crawler
+"""
+
+from typing import Hashable, Iterable, List, Tuple
+
+import ahocorasick
+
+
+class KeywordMatcher:
+    """Matches a fixed set of keywords against text in a single pass
+
+    Keywords are compiled once into an Aho-Corasick automaton, so checking a
+    text costs one scan regardless of how many keywords there are. Keywords
+    are stored lowercase; callers pass already lowercased text.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords = tuple(kw.lower() for kw in keywords)
+        self._automaton = ahocorasick.Automaton()
+        for kw in self.keywords:
+            self._automaton.add_word(kw, kw)
+        if self.keywords:
+            self._automaton.make_automaton()
+
+    def matches(self, text: str) -> bool:
+        """Return True if any keyword occurs in the (lowercase) text"""
+        if not text or not self.keywords:
+            return False
+        return next(self._automaton.iter(text), None) is not None
+
+
+class KeywordTagger:
+    """Finds which of several keyword groups occur in a text in a single pass
+
+    Each tag has its own keyword list and applies when any of them occurs.
+    All keywords share one automaton, so tagging a text costs one scan no
+    matter how many groups there are. Like KeywordMatcher, keywords are
+    stored lowercase and callers pass lowercased text.
+    """
+
+    def __init__(self, tag_keywords: Iterable[Tuple[Hashable, Iterable[str]]]):
+        """
+        Args:
+            tag_keywords: (tag, keywords) pairs; tags() reports tags in this order
+        """
+        self.tags_order: List[Hashable] = []
+        keyword_tags = {}
+        for position, (tag, keywords) in enumerate(tag_keywords):
+            self.tags_order.append(tag)
+            for kw in keywords:
+                keyword_tags.setdefault(kw.lower(), set()).add(position)
+
+        self._automaton = ahocorasick.Automaton()
+        for kw, positions in keyword_tags.items():
+            self._automaton.add_word(kw, tuple(positions))
+        if keyword_tags:
+            self._automaton.make_automaton()
+        self._empty = not keyword_tags
+
+    def tags(self, text: str) -> List[Hashable]:
+        """Return the tags whose keywords occur in the (lowercase) text, in tag order"""
+        if not text or self._empty:
+            return []
+        found = set()
+        for _, positions in self._automaton.iter(text):
+            found.update(positions)
+        return [self.tags_order[position] for position in sorted(found)]
@@ -2,30 +2,29 @@
 HTML parsing utilities for the eInvoice News Crawler
 """
 
-import re
 import html
+import hashlib
 from datetime import datetime
-from typing import Optional
-from bs4 import BeautifulSoup
-import html2text
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+from selectolax.lexbor import LexborHTMLParser
 from dateutil import parser as date_parser
 
+from .keywords import KeywordMatcher, KeywordTagger
+
 
 def clean_text(text: str) -> str:
     """Clean and normalize text content"""
     if not text:
         return ""
 
-    # Unescape HTML entities
-    text = html.unescape(text)
-
-    # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text)
+    # Unescape HTML entities; every entity starts with '&'
+    if '&' in text:
+        text = html.unescape(text)
 
-    # Strip leading/trailing whitespace
-    text = text.strip()
-
-    return text
+    # Collapse runs of whitespace and strip the ends; str.split() splits on
+    # the same Unicode whitespace as \s, in one C pass
+    return ' '.join(text.split())
 
 
 def extract_text_from_html(html_content: str, max_length: int = 500) -> str:
@@ -33,14 +32,11 @@ def extract_text_from_html(html_content: str, max_length: int = 500) -> str:
     if not html_content:
         return ""
 
-    # Convert HTML to text
-    h = html2text.HTML2Text()
-    h.ignore_links = True
-    h.ignore_images = True
-    h.ignore_emphasis = True
-
-    text = h.handle(html_content)
-    text = clean_text(text)
+    # Plain text straight from the C parser; scripts and styles are not prose
+    tree = LexborHTMLParser(html_content)
+    tree.strip_tags(['script', 'style', 'noscript'])
+    root = tree.body or tree.root
+    text = clean_text(root.text(separator=' ') if root else '')
 
     # Truncate if needed
     if len(text) > max_length:
@@ -49,36 +45,81 @@ def extract_text_from_html(html_content: str, max_length: int = 500) -> str:
     return text
 
 
+@lru_cache(maxsize=4096)
 def parse_date(date_str: str) -> Optional[datetime]:
-    """Parse date string into datetime object"""
+    """
+    Parse date string into datetime object
+
+    Cached, since sibling items repeat the same strings; datetimes are
+    immutable, so sharing results is safe.
+    """
     if not date_str:
         return None
 
+    # Fast path for ISO-8601 values, the usual <time datetime="..."> format;
+    # anything fromisoformat() rejects falls through to dateutil
+    if (len(date_str) >= 10 and date_str[4] == '-' and date_str[:4].isdigit()
+            and date_str[5:7].isdigit() and (len(date_str) == 10 or date_str[10] in 'T ')):
+        try:
+            return datetime.fromisoformat(date_str[:-1] + '+00:00' if date_str[-1] == 'Z' else date_str)
+        except ValueError:
+            pass
+
     try:
         return date_parser.parse(date_str)
     except (ValueError, TypeError):
         return None
 
 
-def extract_summary(soup: BeautifulSoup, selectors: list) -> str:
+def css_select(node, selector: str) -> list:
+    """
+    Return the descendants of a parsed node matching a CSS selector
+
+    Behaves like BeautifulSoup's select(): matches are unique, in document
+    order, and never include the node itself. Lexbor's css() returns the node
+    when it matches and repeats elements matched by several selectors of a
+    group, so both are filtered out here.
+    """
+    matches = []
+    # Compare by identity: Node.__eq__ serializes both subtrees to HTML. A
+    # parser (whole document) has no mem_id and is never among its matches.
+    seen = {node.mem_id} if hasattr(node, 'mem_id') else set()
+    for match in node.css(selector):
+        if match.mem_id in seen:
+            continue
+        seen.add(match.mem_id)
+        matches.append(match)
+    return matches
+
+
+def css_select_one(node, selector: str):
+    """Return the first descendant of a parsed node matching a CSS selector, or None"""
+    match = node.css_first(selector)
+    if match is not None and match.mem_id == getattr(node, 'mem_id', None):
+        matches = css_select(node, selector)
+        return matches[0] if matches else None
+    return match
+
+
+def extract_summary(tree: LexborHTMLParser, selectors: list) -> str:
     """Extract summary text using multiple CSS selectors"""
     for selector in selectors:
-        element = soup.select_one(selector)
+        element = css_select_one(tree, selector)
         if element:
-            text = clean_text(element.get_text())
+            text = clean_text(element.text())
             if len(text) > 50:  # Minimum length for a valid summary
                 return text[:300] + '...' if len(text) > 300 else text
 
     return ""
 
 
-def extract_date(soup: BeautifulSoup, selectors: list) -> Optional[datetime]:
+def extract_date(tree: LexborHTMLParser, selectors: list) -> Optional[datetime]:
     """Extract date using multiple CSS selectors"""
     for selector in selectors:
-        element = soup.select_one(selector)
+        element = css_select_one(tree, selector)
         if element:
             # Try datetime attribute first
-            date_str = element.get('datetime') or element.get_text()
+            date_str = element.attributes.get('datetime') or element.text()
             parsed = parse_date(date_str)
             if parsed:
                 return parsed
@@ -88,8 +129,6 @@ def extract_date(soup: BeautifulSoup, selectors: list) -> Optional[datetime]:
 
 def generate_article_id(source_id: str, url: str, date: datetime = None) -> str:
     """Generate a unique article ID"""
-    import hashlib
-
     # Use URL hash for uniqueness
     url_hash = hashlib.md5(url.encode()).hexdigest()[:8]
 
@@ -101,26 +140,36 @@ def generate_article_id(source_id: str, url: str, date: datetime = None) -> str:
     return f"{source_id}-{url_hash}"
 
 
+# Keyword mapping for categories, in reporting order
+CATEGORY_KEYWORDS = {
+    'mandate': ['mandate', 'mandatory', 'required', 'obligation', 'compulsory'],
+    'regulation': ['regulation', 'regulatory', 'law', 'legislation', 'directive', 'framework'],
+    'deadline': ['deadline', 'due date', 'effective date', 'implementation date', 'timeline'],
+    'partnership': ['partner', 'partnership', 'collaboration', 'alliance', 'joint'],
+    'product': ['launch', 'release', 'new feature', 'solution', 'platform', 'tool', 'product'],
+    'compliance': ['compliance', 'compliant', 'certified', 'certification', 'audit'],
+    'expansion': ['expand', 'expansion', 'new office', 'new market', 'growth'],
+    'update': ['update', 'change', 'modification', 'amendment', 'revision']
+}
+
+EINVOICE_KEYWORDS = [
+    'e-invoice', 'einvoice', 'e-invoicing', 'einvoicing',
+    'electronic invoice', 'electronic invoicing',
+    'e-receipt', 'digital invoice', 'tax invoice',
+    'zatca', 'fatoorah', 'fta', 'vat', 'gst',
+    'peppol', 'ubl', 'xrechnung', 'factur-x',
+    'sdi', 'chorus pro', 'ksef', 'cfdi', 'nf-e',
+    'b2b invoice', 'b2g invoice', 'clearance',
+    'tax compliance', 'tax digitalization'
+]
+
+EINVOICE_MATCHER = KeywordMatcher(EINVOICE_KEYWORDS)
+CATEGORY_TAGGER = KeywordTagger(CATEGORY_KEYWORDS.items())
+
+
 def categorize_article(title: str, summary: str) -> list:
     """Categorize article based on title and summary content"""
-    text = (title + ' ' + summary).lower()
-    categories = []
-
-    # Keyword mapping for categories
-    category_keywords = {
-        'mandate': ['mandate', 'mandatory', 'required', 'obligation', 'compulsory'],
-        'regulation': ['regulation', 'regulatory', 'law', 'legislation', 'directive', 'framework'],
-        'deadline': ['deadline', 'due date', 'effective date', 'implementation date', 'timeline'],
-        'partnership': ['partner', 'partnership', 'collaboration', 'alliance', 'joint'],
-        'product': ['launch', 'release', 'new feature', 'solution', 'platform', 'tool', 'product'],
-        'compliance': ['compliance', 'compliant', 'certified', 'certification', 'audit'],
-        'expansion': ['expand', 'expansion', 'new office', 'new market', 'growth'],
-        'update': ['update', 'change', 'modification', 'amendment', 'revision']
-    }
-
-    for category, keywords in category_keywords.items():
-        if any(keyword in text for keyword in keywords):
-            categories.append(category)
+    categories = CATEGORY_TAGGER.tags((title + ' ' + summary).lower())
 
     # Default to 'update' if no categories found
     if not categories:
@@ -132,17 +181,50 @@ def categorize_article(title: str, summary: str) -> list:
 
 def is_einvoice_related(title: str, summary: str) -> bool:
     """Check if article is related to e-invoicing"""
-    text = (title + ' ' + summary).lower()
-
-    keywords = [
-        'e-invoice', 'einvoice', 'e-invoicing', 'einvoicing',
-        'electronic invoice', 'electronic invoicing',
-        'e-receipt', 'digital invoice', 'tax invoice',
-        'zatca', 'fatoorah', 'fta', 'vat', 'gst',
-        'peppol', 'ubl', 'xrechnung', 'factur-x',
-        'sdi', 'chorus pro', 'ksef', 'cfdi', 'nf-e',
-        'b2b invoice', 'b2g invoice', 'clearance',
-        'tax compliance', 'tax digitalization'
-    ]
-
-    return any(keyword in text for keyword in keywords)
+    return EINVOICE_MATCHER.matches((title + ' ' + summary).lower())
+
+
+class ArticleAnalyzer:
+    """
+    Runs the e-invoice check, country detection and categorization in one pass
+
+    Gives the same results as is_einvoice_related(), categorize_article() and
+    a first-match scan of country_keywords in dict order, but scans the
+    lowercased text once with a single automaton. Crawlers with their own
+    relevance filter pass it as einvoice_keywords.
+
+    The text is padded with a space on each side, so keywords written as
+    ' eu ' match whole words at the start and end of the text as well.
+    """
+
+    def __init__(self, country_keywords: Optional[Dict[str, List[str]]] = None,
+                 einvoice_keywords: Optional[List[str]] = None):
+        if einvoice_keywords is None:
+            einvoice_keywords = EINVOICE_KEYWORDS
+        tag_keywords = [(('einvoice', True), einvoice_keywords)]
+        tag_keywords += [(('category', name), kws) for name, kws in CATEGORY_KEYWORDS.items()]
+        tag_keywords += [(('country', code), kws) for code, kws in (country_keywords or {}).items()]
+        self._tagger = KeywordTagger(tag_keywords)
+
+    def analyze(self, title: str, summary: str) -> Tuple[bool, Optional[str], list]:
+        """
+        Analyze an article
+
+        Returns:
+            (is e-invoice related, country code or None, up to 2 categories)
+        """
+        is_einvoice = False
+        country_code = None
+        categories = []
+
+        for kind, value in self._tagger.tags(f' {title} {summary} '.lower()):
+            if kind == 'einvoice':
+                is_einvoice = True
+            elif kind == 'country':
+                # Tags come back in dict order, so the first country wins
+                if country_code is None:
+                    country_code = value
+            else:
+                categories.append(value)
+
+        return is_einvoice, country_code, (categories or ['update'])[:2]
@@ -49,6 +49,7 @@ function newsApp() {
                 ]);
 
                 this.newsData = await newsResponse.json();
+                await this.loadSyncInfo();
                 const regionsData = await regionsResponse.json();
                 const sourcesData = await sourcesResponse.json();
 
@@ -187,6 +188,7 @@ function newsApp() {
             if (response.ok) {
                 const oldCount = this.newsData.articles.length;
                 this.newsData = await response.json();
+                await this.loadSyncInfo(timestamp);
                 this.filterNews();
                 const diff = this.newsData.articles.length - oldCount;
                 if (diff > 0) {
@@ -197,6 +199,29 @@ function newsApp() {
             }
         },
 
+        /**
+         * Apply the latest sync time and status from last_sync.json.
+         * Runs that find nothing new leave news.json untouched and only
+         * rewrite this sidecar.
+         */
+        async loadSyncInfo(timestamp = null) {
+            try {
+                const url = timestamp ? `data/last_sync.json?t=${timestamp}` : 'data/last_sync.json';
+                const response = await fetch(url);
+                if (!response.ok) {
+                    return;
+                }
+                const sync = await response.json();
+                if (sync.lastUpdated && (!this.newsData.lastUpdated
+                        || new Date(sync.lastUpdated) > new Date(this.newsData.lastUpdated))) {
+                    this.newsData.lastUpdated = sync.lastUpdated;
+                    this.newsData.crawlStatus = sync.crawlStatus;
+                }
+            } catch (error) {
+                console.warn('Failed to load sync info:', error);
+            }
+        },
+
         /**
          * Sleep helper
          */